@@ -25,4 +25,8 @@ from pyngham.pyngham import PyNGHam
 from pyngham.rs import RS
 from pyngham.spp import PyNGHamSPP, SPPType
 from pyngham.extension import PyNGHamExtension
+from pyngham.scheduler import PyNGHamScheduler
+from pyngham.fragment import PyNGHamFragmenter, PyNGHamReassembler
+from pyngham.txqueue import PyNGHamTXQueue, TXPriority
+from pyngham.sync import PyNGHamSync, PyNGHamBitSync
 from pyngham.version import __version__
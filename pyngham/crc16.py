@@ -0,0 +1,76 @@
+#
+# crc16.py
+# 
+# Copyright (C) 2023, Gabriel Mariano Marcelino - PU5GMA <gabriel.mm8@gmail.com>
+# 
+# This file is part of PyNGHam library.
+# 
+# PyNGHam library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# 
+# PyNGHam library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+# 
+# You should have received a copy of the GNU Lesser General Public License
+# along with PyNGHam library. If not, see <http://www.gnu.org/licenses/>.
+# 
+#
+
+
+import binascii
+
+# CRC-16/X.25 (polynomial=0x1021 reflected, init=0xFFFF, xorout=0xFFFF), used by the NGHam packets and the SPP
+CRC16_INIT      = 0xFFFF
+CRC16_XOROUT    = 0xFFFF
+
+# Bit reversal of every byte value
+_BIT_REVERSE    = bytes(int('{:08b}'.format(i)[::-1], 2) for i in range(256))
+
+def _reverse16(x):
+    """
+    Reverses the bits of a 16-bit value.
+
+    :param x: is the value to reverse.
+    :type x: int
+
+    :return: The reversed value.
+    :rtype: int
+    """
+    return (_BIT_REVERSE[x & 0xFF] << 8) | _BIT_REVERSE[x >> 8]
+
+def crc16_update(crc, data):
+    """
+    Updates a CRC-16/X.25 register with a sequence of bytes.
+
+    The reflected CRC is computed by the table-driven CRC-CCITT of the binascii module (crc_hqx), with the bits of
+    the data and of the register reversed by a 256-entry lookup table.
+
+    :param crc: is the current value of the CRC register (CRC16_INIT at the beginning).
+    :type crc: int
+
+    :param data: is the data to add to the CRC.
+    :type data: bytes, bytearray, memoryview or list[int]
+
+    :return: The new value of the CRC register.
+    :rtype: int
+    """
+    if not isinstance(data, (bytes, bytearray)):
+        data = bytes(data)
+
+    return _reverse16(binascii.crc_hqx(data.translate(_BIT_REVERSE), _reverse16(crc)))
+
+def crc16(data):
+    """
+    Computes the CRC-16/X.25 of a sequence of bytes.
+
+    :param data: is the data to compute the CRC.
+    :type data: bytes, bytearray, memoryview or list[int]
+
+    :return: The CRC value.
+    :rtype: int
+    """
+    return crc16_update(CRC16_INIT, data) ^ CRC16_XOROUT
@@ -0,0 +1,247 @@
+#
+# fragment.py
+#
+# Copyright (C) 2023, Gabriel Mariano Marcelino - PU5GMA <gabriel.mm8@gmail.com>
+#
+# This file is part of PyNGHam library.
+#
+# PyNGHam library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# PyNGHam library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with PyNGHam library. If not, see <http://www.gnu.org/licenses/>.
+#
+#
+
+
+from collections import OrderedDict
+
+from pyngham.pyngham import PyNGHam, _PYNGHAM_PL_SIZES, _payload_bytes
+from pyngham.extension import ExtPktType
+
+_PYNGHAM_FRAG_HEADER_SIZE       = 6     # Object ID, fragment sequence number and total of fragments (16 bits each)
+_PYNGHAM_FRAG_MAX_CHUNK_SIZE    = _PYNGHAM_PL_SIZES[-1] - 2 - _PYNGHAM_FRAG_HEADER_SIZE
+_PYNGHAM_FRAG_MAX_FRAGMENTS     = 0xFFFF
+_PYNGHAM_FRAG_MAX_OBJ_ID        = 0xFFFF
+
+class PyNGHamFragmenter:
+    """
+    Class to split objects larger than a NGHam payload into a sequence of frames.
+
+    Each fragment is transmitted as a DATA extension packet, with a header containing the object ID, the sequence
+    number of the fragment and the total number of fragments of the object (16 bits each, big-endian).
+    """
+
+    def __init__(self, ngham=None, flags=0, chunk_size=_PYNGHAM_FRAG_MAX_CHUNK_SIZE):
+        """
+        Constructor.
+
+        :param ngham: NGHam encoder used to generate the frames. If None, a new one is created with the default parameters.
+        :type ngham: PyNGHam, optional
+
+        :param flags: Flags of the generated NGHam packets, default 0.
+        :type flags: int, optional
+
+        :param chunk_size: Number of bytes of the object in each fragment (1 to 212), default 212 (the largest NGHam size class).
+        :type chunk_size: int, optional
+
+        :return: None.
+        :rtype: None
+        """
+        if (chunk_size < 1) or (chunk_size > _PYNGHAM_FRAG_MAX_CHUNK_SIZE):
+            raise ValueError('The chunk size must be between 1 and ' + str(_PYNGHAM_FRAG_MAX_CHUNK_SIZE) + ' bytes')
+
+        if ngham is None:
+            ngham = PyNGHam()
+
+        self._ngham = ngham
+        self._flags = flags
+        self._chunk_size = chunk_size
+
+    def fragment(self, obj, obj_id):
+        """
+        Splits an object into NGHam payloads.
+
+        :param obj: Object to split.
+        :type obj: list[int], bytes, bytearray, memoryview or str
+
+        :param obj_id: ID of the object (0 to 65535).
+        :type obj_id: int
+
+        :return: The payloads of the fragments (each one with a single DATA extension packet).
+        :rtype: list[bytes]
+        """
+        if (obj_id < 0) or (obj_id > _PYNGHAM_FRAG_MAX_OBJ_ID):
+            raise ValueError('The object ID must be between 0 and ' + str(_PYNGHAM_FRAG_MAX_OBJ_ID) + ' (got ' + str(obj_id) + ')')
+
+        obj = memoryview(_payload_bytes(obj)).cast('B')
+
+        total = max(1, -(-len(obj) // self._chunk_size))
+
+        if total > _PYNGHAM_FRAG_MAX_FRAGMENTS:
+            raise ValueError('The object is too large (' + str(len(obj)) + ' bytes)')
+
+        pls = list()
+        for seq in range(total):
+            chunk = obj[seq * self._chunk_size:(seq + 1) * self._chunk_size]
+
+            pl = bytearray(2 + _PYNGHAM_FRAG_HEADER_SIZE + len(chunk))
+            pl[0] = ExtPktType.DATA.value
+            pl[1] = _PYNGHAM_FRAG_HEADER_SIZE + len(chunk)
+            pl[2:8] = bytes([(obj_id >> 8) & 0xFF, obj_id & 0xFF, (seq >> 8) & 0xFF, seq & 0xFF, (total >> 8) & 0xFF, total & 0xFF])
+            pl[8:] = chunk
+
+            pls.append(bytes(pl))
+
+        return pls
+
+    def encode(self, obj, obj_id):
+        """
+        Splits an object and encodes the fragments as NGHam packets.
+
+        The fragments are encoded at once (see PyNGHam.encode_many).
+
+        :param obj: Object to split.
+        :type obj: list[int], bytes, bytearray, memoryview or str
+
+        :param obj_id: ID of the object (0 to 65535).
+        :type obj_id: int
+
+        :return: A buffer with all the encoded packets and a list with the offset of each packet in the buffer (plus the length of the buffer at the end).
+        :rtype: bytes, list[int]
+        """
+        return self._ngham.encode_many(self.fragment(obj, obj_id), self._flags)
+
+class PyNGHamReassembler:
+    """
+    Class to reassemble objects from received fragments.
+
+    The fragments can be received in any order. The memory is bounded by the maximum number of objects being
+    reassembled at the same time and by the maximum size of each object.
+    """
+
+    def __init__(self, max_objects=8, max_fragments=1024):
+        """
+        Constructor.
+
+        :param max_objects: Maximum number of incomplete objects (the oldest one is discarded when a new object arrives), default 8.
+        :type max_objects: int, optional
+
+        :param max_fragments: Maximum number of fragments of an object (objects with more fragments are ignored), default 1024.
+        :type max_fragments: int, optional
+
+        :return: None.
+        :rtype: None
+        """
+        self._max_objects = max_objects
+        self._max_fragments = max_fragments
+        self._objects = OrderedDict()   # Object ID -> [total, bitmap of received fragments, chunks]
+
+    def add(self, pl):
+        """
+        Adds a received NGHam payload.
+
+        All DATA extension packets with a fragment header in the payload are processed. Other extension packets are
+        ignored.
+
+        :param pl: Decoded NGHam payload.
+        :type pl: list[int], bytes, bytearray or memoryview
+
+        :return: A list with the objects completed by the given payload, as tuples with the object ID and its content.
+        :rtype: list[tuple[int, bytes]]
+        """
+        pl = _payload_bytes(pl)
+
+        res = list()
+
+        i = 0
+        while(i + 2 <= len(pl)):
+            length = pl[i + 1]
+
+            if i + 2 + length > len(pl):
+                break
+
+            if (pl[i] == ExtPktType.DATA.value) and (length >= _PYNGHAM_FRAG_HEADER_SIZE):
+                obj = self._add_fragment(pl[i + 2:i + 2 + length])
+                if obj is not None:
+                    res.append(obj)
+
+            i = i + 2 + length
+
+        return res
+
+    def missing(self, obj_id):
+        """
+        Gets the fragments not received yet of an object.
+
+        :param obj_id: ID of the object.
+        :type obj_id: int
+
+        :return: The sequence numbers of the missing fragments (empty if the object is unknown).
+        :rtype: list[int]
+        """
+        if obj_id not in self._objects:
+            return list()
+
+        total, bitmap, chunks = self._objects[obj_id]
+
+        missing = ((1 << total) - 1) & ~bitmap
+
+        return [seq for seq in range(total) if (missing >> seq) & 1]
+
+    def pending(self):
+        """
+        Gets the IDs of the incomplete objects.
+
+        :return: The IDs of the objects being reassembled (from the oldest to the newest).
+        :rtype: list[int]
+        """
+        return list(self._objects.keys())
+
+    def _add_fragment(self, frag):
+        """
+        Stores a fragment.
+
+        :param frag: Content of a DATA extension packet (fragment header and chunk).
+        :type frag: bytes
+
+        :return: The object ID and its content if the object is complete, or None otherwise.
+        :rtype: tuple[int, bytes]
+        """
+        obj_id = (frag[0] << 8) | frag[1]
+        seq = (frag[2] << 8) | frag[3]
+        total = (frag[4] << 8) | frag[5]
+
+        if (total == 0) or (total > self._max_fragments) or (seq >= total):
+            return None
+
+        obj = self._objects.get(obj_id)
+
+        if (obj is None) or (obj[0] != total):
+            # New object (or a new transmission with the same ID)
+            obj = [total, 0, [None] * total]
+            self._objects[obj_id] = obj
+            self._objects.move_to_end(obj_id)
+
+            if len(self._objects) > self._max_objects:
+                self._objects.popitem(last=False)
+
+        if (obj[1] >> seq) & 1:
+            return None     # Duplicated fragment
+
+        obj[1] = obj[1] | (1 << seq)
+        obj[2][seq] = bytes(frag[_PYNGHAM_FRAG_HEADER_SIZE:])
+
+        if obj[1] != (1 << total) - 1:
+            return None
+
+        del self._objects[obj_id]
+
+        return obj_id, b''.join(obj[2])
@@ -22,8 +22,15 @@
 
 
 from enum import Enum
-from crc import Calculator, Configuration
-from pyngham.rs import RS
+from collections import OrderedDict
+
+try:
+    import numpy as np
+except ImportError:     # NumPy is optional, it is only used to speed up the batch methods
+    np = None
+from pyngham.symbols import bytes_to_symbols, symbols_to_bytes
+from pyngham.crc16 import crc16, crc16_update, CRC16_INIT, CRC16_XOROUT
+from pyngham.rs import get_backend
 
 # There are seven different sizes
 # Each size has a correlation tag for size, a total size, a maximum payload size and a parity data size
@@ -31,6 +38,7 @@ _PYNGHAM_SIZES                  = 7
 _PYNGHAM_PL_SIZES               = [28, 60, 92,  124, 156, 188, 220]
 _PYNGHAM_PL_SIZES_FULL          = [31, 63, 95,  127, 159, 191, 223]
 _PYNGHAM_PL_PAR_SIZES           = [47, 79, 111, 159, 191, 223, 255]
+_PYNGHAM_PL_PAR_SIZES_NR        = {size: i for i, size in enumerate(_PYNGHAM_PL_PAR_SIZES)}
 _PYNGHAM_PAR_SIZES              = [16, 16, 16,  32,  32,  32,  32]
 
 class State(Enum):
@@ -63,6 +71,9 @@ _PYNGHAM_SIZE_TAGS              = [[0x3B, 0x49, 0xCD],
 # Maximum number of errors in the size tag
 _PYNGHAM_SIZE_TAG_MAX_ERROR     = 6
 
+# The size tags as 24-bit integers
+_PYNGHAM_SIZE_TAGS_INT          = [(tag[0] << 16) | (tag[1] << 8) | tag[2] for tag in _PYNGHAM_SIZE_TAGS]
+
 # Preamble and synchronization vector
 _PYNGHAM_PREAMBLE               = 4*[0xAA]
 _PYNGHAM_SYNC_WORD              = [0x5D, 0xE6, 0x2A, 0x7E]
@@ -91,10 +102,86 @@ _PYNGHAM_CCSDS_POLY             = [0xFF, 0x48, 0x0E, 0xC0, 0x9A, 0x0D, 0x70, 0xB
                                    0xD6, 0xD3, 0xDB, 0xA3, 0x67, 0x2D, 0x4B, 0xBE, 0xE6, 0x19, 0x51, 0x5F, 0x9F,
                                    0x05, 0x08, 0x78, 0xC4, 0x4A, 0x66, 0xF5, 0x58]
 
+# CCSDS scrambling sequence as a single integer (first byte in the most significant position)
+_PYNGHAM_CCSDS_POLY_INT         = int.from_bytes(bytes(_PYNGHAM_CCSDS_POLY), 'big')
+
+# Preamble, sync word and size tag of each size, for the two and four level modulations
+_PYNGHAM_HEADER_TEMPLATES       = [[bytes(_PYNGHAM_PREAMBLE + _PYNGHAM_SYNC_WORD + tag) for tag in _PYNGHAM_SIZE_TAGS],
+                                   [bytes(_PYNGHAM_PREAMBLE_FOUR_LEVEL + _PYNGHAM_SYNC_WORD_FOUR_LEVEL + tag) for tag in _PYNGHAM_SIZE_TAGS]]
+
+# Maximum size of a packet (four level preamble and sync word, size tag and the largest codeword)
+_PYNGHAM_PKT_MAX_SIZE           = len(_PYNGHAM_PREAMBLE_FOUR_LEVEL) + len(_PYNGHAM_SYNC_WORD_FOUR_LEVEL) + len(_PYNGHAM_SIZE_TAGS[0]) + _PYNGHAM_PL_PAR_SIZES[-1]
+
 _PYNGHAM_PADDING_BM             = 0x1F
 _PYNGHAM_FLAGS_BM               = 0xE0
 _PYNGHAM_FLAGS_BP               = 5
 
+# Results without decoded data (shared and immutable, no allocation per byte)
+_PYNGHAM_DECODE_NOT_READY       = ((), 0, ())   # Packet not complete yet
+_PYNGHAM_DECODE_ERROR           = ((), -1, ())  # Impossible to decode the packet
+
+
+def _payload_bytes(pl):
+    """
+    Converts a payload to a bytes-like object.
+
+    :param pl: Payload (list of integers, bytes, byte array, memoryview or string).
+    :type pl: list[int], bytes, bytearray, memoryview or str
+
+    :return: The payload as bytes (or the given object, if it is already bytes-like).
+    :rtype: bytes, bytearray or memoryview
+    """
+    if isinstance(pl, str):
+        return bytes([ord(x) for x in pl])
+    elif not isinstance(pl, (bytes, bytearray, memoryview)):
+        return bytes(pl)
+
+    return pl
+
+if hasattr(int, 'bit_count'):
+    _popcount = int.bit_count
+else:
+    def _popcount(x):
+        return bin(x).count('1')
+
+def _buffer_bytes(data):
+    """
+    Gets a sequence of bytes as an object supporting the buffer protocol, without copying when possible.
+
+    :param data: Sequence of bytes (list of integers, bytes, byte array, memoryview or NumPy array).
+    :type data: list[int], bytes, bytearray, memoryview or numpy.ndarray
+
+    :return: The given bytes (a memoryview of the same memory if data is a contiguous buffer of bytes).
+    :rtype: bytes, bytearray or memoryview
+    """
+    if isinstance(data, (bytes, bytearray)):
+        return data
+
+    try:
+        view = memoryview(data)
+    except TypeError:
+        return bytes(data)
+
+    if (view.itemsize == 1) and view.c_contiguous:
+        return view.cast('B')
+
+    return bytes(iter(data))    # Not bytes (a NumPy array of int64, for example)
+
+def _scramble(data):
+    """
+    Scrambles (or de-scrambles) a block of bytes with the CCSDS sequence.
+
+    The whole block is XORed with the beginning of the sequence at once, as big integers.
+
+    :param data: Block of bytes to scramble (up to 255 bytes).
+    :type data: bytes, bytearray or memoryview
+
+    :return: The scrambled block.
+    :rtype: bytes
+    """
+    n = len(data)
+
+    return (int.from_bytes(data, 'big') ^ (_PYNGHAM_CCSDS_POLY_INT >> (8 * (len(_PYNGHAM_CCSDS_POLY) - n)))).to_bytes(n, 'big')
 
 class PyNGHam:
     """
@@ -103,7 +190,7 @@ class PyNGHam:
     This class is used to encode and/or decode a NGHam packet.
     """
 
-    def __init__(self, mod=0):
+    def __init__(self, mod=0, backend=None, cache_size=0, try_all_sizes=False):
         """
         Class initialization.
 
@@ -112,24 +199,44 @@ class PyNGHam:
         :param mod: Modulation type (two=0 or four level=1, default 0).
         :type mod: int, optional
 
+        :param backend: Reed-Solomon backend ("python", "numpy" or "auto"). If None, the environment variable PYNGHAM_RS_BACKEND is used (default "auto").
+        :type backend: str, optional
+
+        :param cache_size: Maximum number of encoded packets kept in the encode cache (least recently used packets are discarded first), default 0 (no cache).
+        :type cache_size: int, optional
+
+        :param try_all_sizes: If True, packets with a damaged size tag are decoded trying every size (see decode()), default False.
+        :type try_all_sizes: bool, optional
+
         :return: None.
         :rtype: None
         """
         self._modulation = mod
 
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+        self._try_all_sizes = try_all_sizes
+
         self._decoder_size_nr = int()
         self._decoder_size_tag = int()
         self._decoder_state = State.SIZE_TAG.value
-        self._decoder_buf = list()
+        self._decoder_buf = bytearray(_PYNGHAM_PL_PAR_SIZES[-1])    # Preallocated for the largest codeword
+        self._decoder_rel = [None] * _PYNGHAM_PL_PAR_SIZES[-1]
+        self._decoder_len = 0
+
+        rs = get_backend(backend)
 
         self._rsc = list()
-        self._rsc.append(RS(8, 0x187, 112, 11, 16, _PYNGHAM_PL_PAR_SIZES[-1] - _PYNGHAM_PL_PAR_SIZES[0]))
-        self._rsc.append(RS(8, 0x187, 112, 11, 16, _PYNGHAM_PL_PAR_SIZES[-1] - _PYNGHAM_PL_PAR_SIZES[1]))
-        self._rsc.append(RS(8, 0x187, 112, 11, 16, _PYNGHAM_PL_PAR_SIZES[-1] - _PYNGHAM_PL_PAR_SIZES[2]))
-        self._rsc.append(RS(8, 0x187, 112, 11, 32, _PYNGHAM_PL_PAR_SIZES[-1] - _PYNGHAM_PL_PAR_SIZES[3]))
-        self._rsc.append(RS(8, 0x187, 112, 11, 32, _PYNGHAM_PL_PAR_SIZES[-1] - _PYNGHAM_PL_PAR_SIZES[4]))
-        self._rsc.append(RS(8, 0x187, 112, 11, 32, _PYNGHAM_PL_PAR_SIZES[-1] - _PYNGHAM_PL_PAR_SIZES[5]))
-        self._rsc.append(RS(8, 0x187, 112, 11, 32, _PYNGHAM_PL_PAR_SIZES[-1] - _PYNGHAM_PL_PAR_SIZES[6]))
+        self._rsc.append(rs(8, 0x187, 112, 11, 16, _PYNGHAM_PL_PAR_SIZES[-1] - _PYNGHAM_PL_PAR_SIZES[0]))
+        self._rsc.append(rs(8, 0x187, 112, 11, 16, _PYNGHAM_PL_PAR_SIZES[-1] - _PYNGHAM_PL_PAR_SIZES[1]))
+        self._rsc.append(rs(8, 0x187, 112, 11, 16, _PYNGHAM_PL_PAR_SIZES[-1] - _PYNGHAM_PL_PAR_SIZES[2]))
+        self._rsc.append(rs(8, 0x187, 112, 11, 32, _PYNGHAM_PL_PAR_SIZES[-1] - _PYNGHAM_PL_PAR_SIZES[3]))
+        self._rsc.append(rs(8, 0x187, 112, 11, 32, _PYNGHAM_PL_PAR_SIZES[-1] - _PYNGHAM_PL_PAR_SIZES[4]))
+        self._rsc.append(rs(8, 0x187, 112, 11, 32, _PYNGHAM_PL_PAR_SIZES[-1] - _PYNGHAM_PL_PAR_SIZES[5]))
+        self._rsc.append(rs(8, 0x187, 112, 11, 32, _PYNGHAM_PL_PAR_SIZES[-1] - _PYNGHAM_PL_PAR_SIZES[6]))
 
     def __str__(self):
         """
@@ -140,6 +247,37 @@ class PyNGHam:
         """
         return 'NGHam Protocol Handler'
 
+    def _find_size(self, size_tag):
+        """
+        Finds the size number of a received size tag.
+
+        :param size_tag: Received size tag (24 bits).
+        :type size_tag: int
+
+        :return: The size number (0 to 6), or -1 if the size tag is not valid.
+        :rtype: int
+        """
+        size_nr, distance = self._classify_size_tag(size_tag)
+
+        return size_nr if distance <= _PYNGHAM_SIZE_TAG_MAX_ERROR else -1
+
+    def _classify_size_tag(self, size_tag):
+        """
+        Finds the nearest size tag of a received size tag.
+
+        The size tags are at least 13 bits apart, so the nearest tag is unique when up to 6 bits are wrong.
+
+        :param size_tag: Received size tag (24 bits).
+        :type size_tag: int
+
+        :return: The size number of the nearest size tag and its distance (number of different bits).
+        :rtype: int, int
+        """
+        distances = [_popcount(size_tag ^ tag) for tag in _PYNGHAM_SIZE_TAGS_INT]
+        distance = min(distances)
+
+        return distances.index(distance), distance
+
     def _tag_check(self, x, y):
         """
         Verifies if a size tag is valid or not.
@@ -153,23 +291,7 @@ class PyNGHam:
         :return: True/False if the tag comparison passed or not.
         :rtype: bool
         """
-        j = int()
-        distance = int()
-        diff = x ^ y
-
-        # Early check to save time
-        if not diff:
-            return True
-
-        distance = 0
-        for j in range(24):
-            if diff & 0x01:
-                distance = distance + 1
-                if distance > _PYNGHAM_SIZE_TAG_MAX_ERROR:
-                    return False
-            diff = diff >> 1
-
-        return True
+        return _popcount(x ^ y) <= _PYNGHAM_SIZE_TAG_MAX_ERROR
 
     def encode(self, pl, flags=0):
         """
@@ -184,80 +306,403 @@ class PyNGHam:
         :return: An encoded NGHam packet.
         :rtype: list[int]
         """
-        if isinstance(pl, str):
-            pl = [ord(x) for x in pl]
-        pl = list(pl)   # Ensure that the input is a list of ints
-        pkt = list()
+        return list(self.encode_bytes(pl, flags))
+
+    def encode_bytes(self, pl, flags=0):
+        """
+        Encodes a sequence of bytes as a NGHam packet, returning the packet as bytes.
+
+        If the encode cache is enabled (see cache_size in the constructor), a packet already encoded with the same
+        payload and flags is returned from the cache.
+
+        :param pl: Data to encode as a NGHam packet (list of integeres, bytes, byte array or string).
+        :type pl: list[int], bytes, bytearray or str
+
+        :param flags: Packet flags, default 0.
+        :type flags: int, optional
+
+        :return: An encoded NGHam packet (empty if the payload is empty or greater than 220 bytes).
+        :rtype: bytes
+        """
+        if self._cache_size > 0:
+            pl = bytes(_payload_bytes(pl))
+            key = (pl, flags, self._modulation)
+
+            if key in self._cache:
+                self._cache_hits = self._cache_hits + 1
+                self._cache.move_to_end(key)
+
+                return self._cache[key]
+
+            self._cache_misses = self._cache_misses + 1
+
+        buf = bytearray(_PYNGHAM_PKT_MAX_SIZE)
+        pkt = bytes(buf[:self._encode_into(buf, 0, pl, flags)])
+
+        if self._cache_size > 0:
+            self._cache[key] = pkt
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+        return pkt
+
+    def cache_info(self):
+        """
+        Gets the statistics of the encode cache.
+
+        :return: A dictionary with the number of hits, misses, the current size and the maximum size of the cache.
+        :rtype: dict
+        """
+        return {
+            "hits" :        self._cache_hits,
+            "misses" :      self._cache_misses,
+            "size" :        len(self._cache),
+            "max_size" :    self._cache_size
+        }
+
+    def cache_clear(self):
+        """
+        Clears the encode cache and its statistics.
+
+        :return: None.
+        :rtype: None
+        """
+        self._cache.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def encode_symbols(self, pl, flags=0):
+        """
+        Encodes a sequence of bytes as a NGHam packet, returning the symbols of the packet (requires NumPy).
+
+        The symbols are -1/+1 for the two level modulation and -3/-1/+1/+3 for the four level modulation (see
+        pyngham.symbols). A batch of packets can be mapped at once with bytes_to_symbols() over the buffer of
+        encode_many() (the symbol offsets are the byte offsets times 8 or 4).
+
+        :param pl: Data to encode as a NGHam packet (list of integeres, bytes, byte array or string).
+        :type pl: list[int], bytes, bytearray or str
+
+        :param flags: Packet flags, default 0.
+        :type flags: int, optional
+
+        :return: The symbols of the encoded NGHam packet.
+        :rtype: numpy.ndarray (int8)
+        """
+        return bytes_to_symbols(self.encode_bytes(pl, flags), self._modulation)
+
+    def encode_into(self, buf, offset, pl, flags=0):
+        """
+        Encodes a sequence of bytes as a NGHam packet directly into a given buffer.
+
+        The preamble, sync word, size tag, header, payload, checksum, padding and parity data are written (and
+        scrambled) in place, without intermediate lists. If the encode cache is enabled, a packet already encoded is
+        copied from the cache.
+
+        :param buf: Buffer to write the packet (at least 274 bytes after the offset are enough for any packet).
+        :type buf: bytearray, memoryview or any writable buffer of bytes
+
+        :param offset: Position of the buffer to write the first byte of the packet.
+        :type offset: int
+
+        :param pl: Data to encode as a NGHam packet (list of integeres, bytes, byte array or string).
+        :type pl: list[int], bytes, bytearray or str
+
+        :param flags: Packet flags, default 0.
+        :type flags: int, optional
+
+        :return: The length of the encoded packet (0 if the payload is empty or greater than 220 bytes).
+        :rtype: int
+        """
+        if self._cache_size > 0:
+            pkt = self.encode_bytes(pl, flags)
+
+            buf = memoryview(buf).cast('B')
+            if len(buf) < offset + len(pkt):
+                raise ValueError('The buffer is too small for the packet (' + str(len(pkt)) + ' bytes)')
+
+            buf[offset:offset + len(pkt)] = pkt
+
+            return len(pkt)
+
+        return self._encode_into(buf, offset, pl, flags)
+
+    def _encode_into(self, buf, offset, pl, flags=0):
+        """
+        Encodes a sequence of bytes as a NGHam packet directly into a given buffer (without the encode cache).
+
+        :param buf: Buffer to write the packet.
+        :type buf: bytearray, memoryview or any writable buffer of bytes
+
+        :param offset: Position of the buffer to write the first byte of the packet.
+        :type offset: int
+
+        :param pl: Data to encode as a NGHam packet (list of integeres, bytes, byte array or string).
+        :type pl: list[int], bytes, bytearray or str
+
+        :param flags: Packet flags, default 0.
+        :type flags: int, optional
+
+        :return: The length of the encoded packet (0 if the payload is empty or greater than 220 bytes).
+        :rtype: int
+        """
+        pl = _payload_bytes(pl)
         size_nr = 0
-        codeword_start = 0
 
         # Check size and find control block for smallest possible RS codeword
         if (len(pl) == 0) or (len(pl) > _PYNGHAM_PL_SIZES[_PYNGHAM_SIZES-1]):
-            return list()   # The given payload is greater than 220 bytes
+            return 0    # The given payload is greater than 220 bytes
 
         while(len(pl) > _PYNGHAM_PL_SIZES[size_nr]):
             size_nr = size_nr + 1
 
-        # Insert preamble and sync word
-        if self._modulation == 0:
-            codeword_start = len(_PYNGHAM_PREAMBLE) + len(_PYNGHAM_SYNC_WORD) + len(_PYNGHAM_SIZE_TAGS[0])
-            pkt = pkt + _PYNGHAM_PREAMBLE
-            pkt = pkt + _PYNGHAM_SYNC_WORD
-        else:
-            codeword_start = len(_PYNGHAM_PREAMBLE_FOUR_LEVEL) + len(_PYNGHAM_SYNC_WORD_FOUR_LEVEL) + len(_PYNGHAM_SIZE_TAGS[0])
-            pkt = pkt + _PYNGHAM_PREAMBLE_FOUR_LEVEL
-            pkt = pkt + _PYNGHAM_SYNC_WORD_FOUR_LEVEL
+        header = _PYNGHAM_HEADER_TEMPLATES[0 if self._modulation == 0 else 1][size_nr]
+
+        codeword_start = offset + len(header)
+        data_end = codeword_start + _PYNGHAM_PL_SIZES_FULL[size_nr]
+        pkt_end = codeword_start + _PYNGHAM_PL_PAR_SIZES[size_nr]
+
+        buf = memoryview(buf).cast('B')
+        if len(buf) < pkt_end:
+            raise ValueError('The buffer is too small for the packet (' + str(pkt_end - offset) + ' bytes)')
 
-        # Insert size tag
-        pkt = pkt + _PYNGHAM_SIZE_TAGS[size_nr]
+        # Insert preamble, sync word and size tag
+        buf[offset:codeword_start] = header
 
         # Insert header
-        pkt = pkt + [((_PYNGHAM_PL_SIZES[size_nr] - len(pl)) & 0x1F) | ((flags << 5) & 0xE0)]
+        buf[codeword_start] = ((_PYNGHAM_PL_SIZES[size_nr] - len(pl)) & 0x1F) | ((flags << 5) & 0xE0)
 
         # Insert payload
-        pkt = pkt + pl
+        buf[codeword_start + 1:codeword_start + 1 + len(pl)] = pl
 
         # Insert checksum
-        checksum = Calculator(Configuration(16, 0x1021, 0xFFFF, 0xFFFF, True, True)).checksum(bytes(pkt[codeword_start:]))
-        pkt = pkt + [(checksum >> 8) & 0xFF, checksum & 0xFF]
+        checksum = crc16(buf[codeword_start:codeword_start + 1 + len(pl)])
+        buf[codeword_start + 1 + len(pl)] = (checksum >> 8) & 0xFF
+        buf[codeword_start + 2 + len(pl)] = checksum & 0xFF
 
         # Insert padding
-        pkt = pkt + (_PYNGHAM_PL_SIZES_FULL[size_nr]-len(pl)-3)*[0x00]
+        buf[codeword_start + 3 + len(pl):data_end] = bytes(data_end - codeword_start - 3 - len(pl))
 
         # Insert parity data
-        pkt = pkt + self._rsc[size_nr].encode(pkt[codeword_start:])
+        buf[data_end:pkt_end] = bytes(self._rsc[size_nr].encode(buf[codeword_start:data_end]))
 
         # Scramble
-        for i in range(_PYNGHAM_PL_PAR_SIZES[size_nr]):
-            pkt[codeword_start+i] = pkt[codeword_start+i] ^ _PYNGHAM_CCSDS_POLY[i]
+        buf[codeword_start:pkt_end] = _scramble(buf[codeword_start:pkt_end])
+
+        return pkt_end - offset
+
+    def encode_many(self, pls, flags=0):
+        """
+        Encodes many sequences of bytes as NGHam packets in a single contiguous buffer.
+
+        The payloads are grouped by size, and the checksum, Reed-Solomon parity (the matrix-form batch encoder, when
+        NumPy is available) and scrambling are computed for each group at once.
+
+        :param pls: List of payloads to encode (each one as a list of integers, bytes, byte array or string).
+        :type pls: list
+
+        :param flags: Packet flags, the same for all packets or a list with the flags of each packet, default 0.
+        :type flags: int or list[int], optional
+
+        :return: A buffer with all the encoded packets and a list with the offset of each packet in the buffer (plus the length of the buffer at the end). The packet i is buf[offsets[i]:offsets[i+1]] (empty if its payload is empty or greater than 220 bytes).
+        :rtype: bytes, list[int]
+        """
+        if isinstance(flags, int):
+            flags = [flags] * len(pls)
+
+        pkts = [bytes()] * len(pls)
+        groups = [list() for i in range(_PYNGHAM_SIZES)]
+
+        for i in range(len(pls)):
+            pl = _payload_bytes(pls[i])
+
+            if (len(pl) == 0) or (len(pl) > _PYNGHAM_PL_SIZES[_PYNGHAM_SIZES-1]):
+                continue    # The given payload is greater than 220 bytes
+
+            size_nr = 0
+            while(len(pl) > _PYNGHAM_PL_SIZES[size_nr]):
+                size_nr = size_nr + 1
+
+            # Header, payload, checksum and padding
+            data = bytearray(_PYNGHAM_PL_SIZES_FULL[size_nr])
+            data[0] = ((_PYNGHAM_PL_SIZES[size_nr] - len(pl)) & 0x1F) | ((flags[i] << 5) & 0xE0)
+            data[1:1 + len(pl)] = pl
+            checksum = crc16(memoryview(data)[:1 + len(pl)])
+            data[1 + len(pl)] = (checksum >> 8) & 0xFF
+            data[2 + len(pl)] = checksum & 0xFF
+
+            groups[size_nr].append((i, data))
+
+        for size_nr in range(_PYNGHAM_SIZES):
+            if len(groups[size_nr]) == 0:
+                continue
+
+            header = _PYNGHAM_HEADER_TEMPLATES[0 if self._modulation == 0 else 1][size_nr]
+            rsc = self._rsc[size_nr]
+
+            if (np is not None) and hasattr(rsc, 'encode_batch'):
+                data = np.frombuffer(b''.join([d for i, d in groups[size_nr]]), dtype=np.uint8).reshape(len(groups[size_nr]), -1)
+                codewords = np.hstack((data, rsc.encode_batch(data)))
+                codewords ^= np.frombuffer(bytes(_PYNGHAM_CCSDS_POLY[:codewords.shape[1]]), dtype=np.uint8)
+                for j in range(len(groups[size_nr])):
+                    pkts[groups[size_nr][j][0]] = header + codewords[j].tobytes()
+            else:
+                for i, data in groups[size_nr]:
+                    pkts[i] = header + _scramble(bytes(data) + bytes(rsc.encode(data)))
+
+        offsets = [0]
+        for pkt in pkts:
+            offsets.append(offsets[-1] + len(pkt))
+
+        return b''.join(pkts), offsets
+
+    def encode_update(self, pkt, pl, offsets):
+        """
+        Updates a NGHam packet encoded by encode() with a new payload that differs only in a few bytes.
+
+        Only the changed payload bytes, the CRC and the parity data are updated: as the Reed-Solomon code is linear,
+        the parity is updated with the parity of the difference between the old and the new bytes, and, as the
+        scrambling is a XOR with a fixed sequence, the difference is the same with or without scrambling.
+
+        :param pkt: NGHam packet previously encoded with the same payload length, flags and modulation.
+        :type pkt: list[int] or bytearray
+
+        :param pl: New payload (same length of the payload of pkt).
+        :type pl: list[int], bytearray or str
+
+        :param offsets: Offsets of the bytes of the payload that changed.
+        :type offsets: list[int]
+
+        :return: The updated NGHam packet (an empty list if the packet does not match the payload length or an offset is out of the payload).
+        :rtype: list[int]
+        """
+        if isinstance(pl, str):
+            pl = [ord(x) for x in pl]
+        pl = list(pl)   # Ensure that the input is a list of ints
+        pkt = list(pkt)
+        size_nr = 0
+
+        if (len(pl) == 0) or (len(pl) > _PYNGHAM_PL_SIZES[_PYNGHAM_SIZES-1]):
+            return list()
+
+        while(len(pl) > _PYNGHAM_PL_SIZES[size_nr]):
+            size_nr = size_nr + 1
+
+        if self._modulation == 0:
+            codeword_start = len(_PYNGHAM_PREAMBLE) + len(_PYNGHAM_SYNC_WORD) + len(_PYNGHAM_SIZE_TAGS[0])
+        else:
+            codeword_start = len(_PYNGHAM_PREAMBLE_FOUR_LEVEL) + len(_PYNGHAM_SYNC_WORD_FOUR_LEVEL) + len(_PYNGHAM_SIZE_TAGS[0])
+
+        if len(pkt) != codeword_start + _PYNGHAM_PL_PAR_SIZES[size_nr]:
+            return list()   # The packet does not have the size of this payload
+
+        if _PYNGHAM_PL_SIZES[size_nr] - ((pkt[codeword_start] ^ _PYNGHAM_CCSDS_POLY[0]) & _PYNGHAM_PADDING_BM) != len(pl):
+            return list()   # The packet does not have the payload length of this payload
+
+        offsets = set(offsets)
+        if not offsets.issubset(range(len(pl))):
+            return list()   # Offsets out of the payload
+
+        positions = list()
+        deltas = list()
+
+        # Payload bytes (position 0 of the codeword is the header)
+        for i in offsets:
+            delta = pkt[codeword_start + 1 + i] ^ _PYNGHAM_CCSDS_POLY[1 + i] ^ pl[i]
+            if delta:
+                positions.append(1 + i)
+                deltas.append(delta)
+
+        # Checksum
+        header = pkt[codeword_start] ^ _PYNGHAM_CCSDS_POLY[0]
+        checksum = crc16_update(crc16_update(CRC16_INIT, [header]), pl) ^ CRC16_XOROUT
+        for i, byte in enumerate([(checksum >> 8) & 0xFF, checksum & 0xFF]):
+            delta = pkt[codeword_start + 1 + len(pl) + i] ^ _PYNGHAM_CCSDS_POLY[1 + len(pl) + i] ^ byte
+            if delta:
+                positions.append(1 + len(pl) + i)
+                deltas.append(delta)
+
+        # Apply the differences to the scrambled data and parity
+        for pos, delta in zip(positions, deltas):
+            pkt[codeword_start + pos] = pkt[codeword_start + pos] ^ delta
+
+        parity_start = codeword_start + _PYNGHAM_PL_SIZES_FULL[size_nr]
+        pkt[parity_start:] = self._rsc[size_nr].encode_update(pkt[parity_start:], positions, deltas)
 
         return pkt
 
-    def decode(self, pkt):
+    def decode(self, pkt, reliability=None):
         """
         Decodes a NGHam packet.
 
-        :param pkt: raw NGHam packet to decode.
-        :type pkt: list[int], bytearray or str
+        If the reliability of each byte is given (for example, from the soft decisions of the demodulator), and the
+        packet cannot be decoded, the least reliable bytes are marked as erasures, what allows the Reed-Solomon
+        decoder to correct up to twice more damaged bytes.
+
+        If the object was created with try_all_sizes, a packet with a damaged size tag (more than 6 wrong bits) is
+        decoded trying every size, from the smallest to the largest one, until the CRC is valid (each size is tried once,
+        when its last byte is received). If no size can be decoded, the bytes of the largest codeword are dropped, in
+        the same way in decode, decode_bytes (whatever the size of the chunks) and decode_byte.
 
-        :return: The decoded data, the number of corrected errors and a list with the bit position of the errors.
+        :param pkt: raw NGHam packet to decode (used without copying if it supports the buffer protocol).
+        :type pkt: list[int], bytes, bytearray, memoryview or numpy.ndarray
+
+        :param reliability: reliability of each byte of the packet (the greater, the more reliable), default None.
+        :type reliability: list[float], optional
+
+        :return: The decoded data, the number of corrected errors and a list with the bit position of the errors (empty tuples as data and error positions and -1 errors if the packet cannot be decoded).
         :rtype: list[int], int, list[int]
         """
-        pkt = list(pkt)     # Ensure that the input is a list of ints
+        pkt = _buffer_bytes(pkt)
+        if reliability is not None:
+            reliability = list(reliability)
+
         # Remove preamble and sync word if present
-        if pkt[:8] == _PYNGHAM_PREAMBLE + _PYNGHAM_SYNC_WORD:
-            pkt = pkt[8:]
-        elif pkt[:16] == _PYNGHAM_PREAMBLE_FOUR_LEVEL + _PYNGHAM_SYNC_WORD_FOUR_LEVEL:
-            pkt = pkt[16:]
+        if pkt[:8] == _PYNGHAM_HEADER_TEMPLATES[0][0][:8]:
+            start = 8
+        elif pkt[:16] == _PYNGHAM_HEADER_TEMPLATES[1][0][:16]:
+            start = 16
+        else:
+            start = 0
 
-        for byte in pkt:
-            pl, errors, err_pos = self.decode_byte(byte)
-            if len(pl) > 0:
-                return pl, errors, err_pos
+        for pl, errors, err_pos in self._decode_frames(pkt, start, reliability):
+            return pl, errors, err_pos
+
+        return _PYNGHAM_DECODE_ERROR
+
+    def decode_bytes(self, chunk, reliability=None):
+        """
+        Decodes a chunk of a stream of NGHam packets.
+
+        The decoder state is kept between calls (as in decode_byte), so a packet can be split between chunks. Once the
+        size of a packet is known, its codeword is taken from the chunk at once.
+
+        :param chunk: raw bytes of the stream (the size tags and codewords of the packets, without preamble and sync word).
+        :type chunk: list[int], bytes, bytearray, memoryview or numpy.ndarray
 
-        return list(), -1, list()   # -1 = Error! Impossible to decode the packet!
+        :param reliability: reliability of each byte of the chunk (the greater, the more reliable), default None.
+        :type reliability: list[float], optional
 
-    def decode_byte(self, byte):
+        :return: The packets completed in the given chunk (only the decoded ones), each one as the decoded data, the number of corrected errors and a list with the bit position of the errors.
+        :rtype: list[tuple[list[int], int, list[int]]]
+        """
+        if reliability is not None:
+            reliability = list(reliability)
+
+        return list(self._decode_frames(_buffer_bytes(chunk), 0, reliability))
+
+    def decode_symbols(self, symbols):
+        """
+        Decodes a NGHam packet from its symbols (hard decision, requires NumPy).
+
+        :param symbols: Symbols of the packet (two or four level, according to the modulation of this object), starting at the first symbol of the preamble or of the size tag.
+        :type symbols: list or numpy.ndarray
+
+        :return: The decoded data, the number of corrected errors and a list with the bit position of the errors (empty tuples as data and error positions and -1 errors if the packet cannot be decoded).
+        :rtype: list[int], int, list[int]
+        """
+        return self.decode(symbols_to_bytes(symbols, self._modulation))
+
+    def decode_byte(self, byte, reliability=None):
         """
         Decodes a single byte from a NGHam packet.
 
@@ -266,7 +711,10 @@ class PyNGHam:
         :param byte: byte of a raw NGHam packet to decode.
         :type byte: int
 
-        :return: The decoded data, the number of corrected errors and a list with the bit position of the errors (empty data if the decoding process is not done).
+        :param reliability: reliability of the byte (the greater, the more reliable), used to select erasures (see decode()), default None.
+        :type reliability: float, optional
+
+        :return: The decoded data, the number of corrected errors and a list with the bit position of the errors (empty tuples as data and error positions, with 0 errors if the decoding process is not done, or -1 errors if the packet cannot be decoded).
         :type: list[int], int, list[int]
         """
         if self._decoder_state == State.SIZE_TAG.value:
@@ -274,54 +722,208 @@ class PyNGHam:
 
             self._decoder_state = self._decoder_state + 1
 
-            return list(), 0, list()
+            return _PYNGHAM_DECODE_NOT_READY
         elif self._decoder_state == State.SIZE_TAG_2.value:
             self._decoder_size_tag = self._decoder_size_tag << 8
             self._decoder_size_tag = self._decoder_size_tag | byte
             self._decoder_state = self._decoder_state + 1
 
-            return list(), 0, list()
+            return _PYNGHAM_DECODE_NOT_READY
         elif self._decoder_state == State.SIZE_TAG_3.value:
             self._decoder_size_tag = self._decoder_size_tag << 8
             self._decoder_size_tag = self._decoder_size_tag | byte
 
-            for i in range(_PYNGHAM_SIZES):
-                self._decoder_size_nr = i
-                # If tag is intact, set known size
-                size_tag = (_PYNGHAM_SIZE_TAGS[self._decoder_size_nr][0] << 16) | (_PYNGHAM_SIZE_TAGS[self._decoder_size_nr][1] << 8) | _PYNGHAM_SIZE_TAGS[self._decoder_size_nr][2]
-                if self._tag_check(self._decoder_size_tag, size_tag):
-                    self._decoder_state = State.SIZE_KNOWN.value
-                    self._decoder_buf = []
-                    break
+            size_nr = self._find_size(self._decoder_size_tag)
+            if size_nr >= 0:
+                self._decoder_size_nr = size_nr
+                self._decoder_state = State.SIZE_KNOWN.value
+                self._decoder_len = 0
+            elif self._try_all_sizes:
+                # If size tag is not found, every size is attempted (as soon as the bytes are received)
+                self._decoder_size_nr = -1
+                self._decoder_state = State.SIZE_KNOWN.value
+                self._decoder_len = 0
 
-            # If size tag is not found, every size can theoretically be attempted
             if self._decoder_state != State.SIZE_KNOWN.value:
                 self._decoder_state = State.SIZE_TAG.value
 
-                return list(), 0, list()
+                return _PYNGHAM_DECODE_NOT_READY
 
-            return list(), 0, list()
+            return _PYNGHAM_DECODE_NOT_READY
         elif self._decoder_state == State.SIZE_KNOWN.value:
-            # De-scramble
-            self._decoder_buf.append(byte ^ _PYNGHAM_CCSDS_POLY[len(self._decoder_buf)])
-
-            # Run Reed Solomon decoding, calculate packet length
-            if len(self._decoder_buf) == _PYNGHAM_PL_PAR_SIZES[self._decoder_size_nr]:
+            n = self._decoder_len
+            self._decoder_buf[n] = byte
+            self._decoder_rel[n] = reliability
+            n = n + 1
+            self._decoder_len = n
+
+            if self._decoder_size_nr >= 0:
+                size_nr = self._decoder_size_nr
+                if n != _PYNGHAM_PL_PAR_SIZES[size_nr]:
+                    return _PYNGHAM_DECODE_NOT_READY
+            else:
+                # Unknown size: try to decode the received bytes at the end of each size
+                size_nr = _PYNGHAM_PL_PAR_SIZES_NR.get(n, -1)
+                if size_nr < 0:
+                    return _PYNGHAM_DECODE_NOT_READY
+
+            # De-scramble, run Reed Solomon decoding, calculate packet length
+            codeword = _scramble(memoryview(self._decoder_buf)[:n])
+
+            rel = self._decoder_rel[:n]
+            if None in rel:
+                pl, errors, err_pos = self._decode_codeword(size_nr, codeword)
+            else:
+                pl, errors, err_pos = self._decode_codeword(size_nr, codeword, rel)
+
+            if (self._decoder_size_nr >= 0) or (len(pl) > 0) or (size_nr == _PYNGHAM_SIZES - 1):
                 self._decoder_state = State.SIZE_TAG.value
 
-                pl = list()
-                errors = int()
-                err_pos = list()
+                return pl, errors, err_pos
 
-                pl, errors, err_pos = self._rsc[self._decoder_size_nr].decode(self._decoder_buf, [0], 0)
+            return _PYNGHAM_DECODE_NOT_READY
 
-                pl = list(pl[1:])
-                pl = pl[:_PYNGHAM_PL_SIZES[self._decoder_size_nr] - (self._decoder_buf[0] & _PYNGHAM_PADDING_BM)]
+    def _decode_frames(self, buf, start=0, reliability=None):
+        """
+        Decodes the NGHam packets of a buffer, continuing the current state of the decoder.
 
-                # Check if the packet is decodeable and then if CRC is OK
-                if Calculator(Configuration(16, 0x1021, 0xFFFF, 0xFFFF, True, True)).verify(bytes(self._decoder_buf[:len(pl)+1]), (self._decoder_buf[len(pl)+1] << 8) | self._decoder_buf[len(pl)+2]):
-                    return pl, errors, err_pos
+        The size tags are read directly from the buffer, and the codewords are sliced from it (without copying when the
+        whole codeword is in the buffer). Only the bytes of incomplete size tags are given to decode_byte.
+
+        :param buf: Buffer with the raw bytes to decode.
+        :type buf: bytes, bytearray or memoryview
+
+        :param start: Position of the first byte to decode, default 0.
+        :type start: int, optional
+
+        :param reliability: reliability of each byte of the buffer, default None.
+        :type reliability: list[float], optional
+
+        :return: A generator of the decoded packets (the decoded data, the number of corrected errors and a list with the bit position of the errors).
+        :rtype: generator
+        """
+        pos = start
+        n = len(buf)
+
+        while pos < n:
+            if (self._decoder_state == State.SIZE_TAG.value) and (pos + 3 <= n):
+                size_tag = (buf[pos] << 16) | (buf[pos + 1] << 8) | buf[pos + 2]
+
+                size_nr = self._find_size(size_tag)
+
+                pos = pos + 3
+
+                if (size_nr < 0) and (not self._try_all_sizes):
+                    continue
+
+                # With a damaged size tag (size_nr = -1), every size is attempted as the bytes are received
+                self._decoder_size_nr = size_nr
+                self._decoder_state = State.SIZE_KNOWN.value
+                self._decoder_len = 0
+
+            if self._decoder_state == State.SIZE_KNOWN.value:
+                size_nr = self._decoder_size_nr
+                if size_nr < 0:
+                    # Unknown size: the next size is tried when its last byte is received (as in decode_byte)
+                    size_nr = len([i for i in _PYNGHAM_PL_PAR_SIZES if i <= self._decoder_len])
+
+                length = _PYNGHAM_PL_PAR_SIZES[size_nr]
+
+                if (self._decoder_size_nr >= 0) and (self._decoder_len == 0) and (pos + length <= n):
+                    # Whole codeword in the buffer
+                    codeword = _scramble(buf[pos:pos + length])
+                    rel = None if reliability is None else reliability[pos:pos + length]
+                    pos = pos + length
+                else:
+                    need = min(length - self._decoder_len, n - pos)
+                    self._decoder_buf[self._decoder_len:self._decoder_len + need] = buf[pos:pos + need]
+                    self._decoder_rel[self._decoder_len:self._decoder_len + need] = [None] * need if reliability is None else reliability[pos:pos + need]
+                    self._decoder_len = self._decoder_len + need
+                    pos = pos + need
+
+                    if self._decoder_len < length:
+                        continue
+
+                    codeword = _scramble(memoryview(self._decoder_buf)[:length])
+                    rel = self._decoder_rel[:length]
+
+                if (rel is None) or (None in rel):
+                    pl, errors, err_pos = self._decode_codeword(size_nr, codeword)
                 else:
-                    return list(), -1, list()
+                    pl, errors, err_pos = self._decode_codeword(size_nr, codeword, rel)
+
+                # With an unknown size, the bytes are dropped only if no size could be decoded
+                if (self._decoder_size_nr >= 0) or (len(pl) > 0) or (size_nr == _PYNGHAM_SIZES - 1):
+                    self._decoder_state = State.SIZE_TAG.value
+
+                if len(pl) > 0:
+                    yield pl, errors, err_pos
+
+                continue
+
+            pl, errors, err_pos = self.decode_byte(buf[pos], None if reliability is None else reliability[pos])
+            pos = pos + 1
+
+            if len(pl) > 0:
+                yield pl, errors, err_pos
+
+    def _decode_codeword(self, size_nr, codeword, reliability=None):
+        """
+        Decodes a de-scrambled codeword (Reed-Solomon decoding and CRC check).
+
+        If the reliability of the bytes is given and the codeword cannot be decoded, the decoding is repeated marking
+        2, 4, ... up to the number of parity bytes of the least reliable bytes as erasures, until the CRC is valid.
+
+        :param size_nr: Size number of the codeword (0 to 6).
+        :type size_nr: int
+
+        :param codeword: De-scrambled codeword (header, payload, CRC, padding and parity).
+        :type codeword: list[int] or bytes
+
+        :param reliability: reliability of each byte of the codeword, default None.
+        :type reliability: list[float], optional
+
+        :return: The decoded data, the number of corrected errors and a list with the bit position of the errors (empty tuples as data and error positions and -1 errors if the packet cannot be decoded).
+        :rtype: list[int], int, list[int]
+        """
+        pl, errors, err_pos = self._rsc[size_nr].decode(bytearray(codeword), [0], 0, True)
+
+        pl = self._check_codeword(size_nr, pl)
+        if pl is not None:
+            return pl, errors, err_pos
+
+        if reliability is not None:
+            pad = _PYNGHAM_PL_PAR_SIZES[-1] - _PYNGHAM_PL_PAR_SIZES[size_nr]
+            erasures = [i + pad for i in sorted(range(len(codeword)), key=reliability.__getitem__)]
+
+            for no_eras in range(2, _PYNGHAM_PAR_SIZES[size_nr] + 1, 2):
+                pl, errors, err_pos = self._rsc[size_nr].decode(bytearray(codeword), erasures, no_eras, True)
 
-            return list(), 0, list()
+                pl = self._check_codeword(size_nr, pl)
+                if pl is not None:
+                    return pl, errors, err_pos
+
+        return _PYNGHAM_DECODE_ERROR
+
+    def _check_codeword(self, size_nr, codeword):
+        """
+        Extracts the payload of a decoded codeword, checking its CRC.
+
+        :param size_nr: Size number of the codeword (0 to 6).
+        :type size_nr: int
+
+        :param codeword: Decoded codeword.
+        :type codeword: list[int] or bytearray
+
+        :return: The payload, or None if the CRC is not valid.
+        :rtype: list[int]
+        """
+        pl_len = _PYNGHAM_PL_SIZES[size_nr] - (codeword[0] & _PYNGHAM_PADDING_BM)
+        if pl_len < 0:
+            return None     # Invalid padding (uncorrectable header)
+
+        # Check if the packet is decodeable and then if CRC is OK
+        if crc16(memoryview(codeword)[:pl_len + 1]) == ((codeword[pl_len + 1] << 8) | codeword[pl_len + 2]):
+            return list(codeword[1:1 + pl_len])
+        else:
+            return None
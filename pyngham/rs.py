@@ -22,10 +22,260 @@
 
 
 import math
+import os
+import random
+
+try:
+    import numpy as np
+except ImportError:     # NumPy is optional, it is only required by the batch methods
+    np = None
+
+class GaloisField:
+    """
+    Galois field GF(2^m) arithmetic tables.
+
+    The antilog table has twice the length of the field, so the sum of two logarithms can be used as an index
+    without any modulo operation. The tables are stored as bytes to keep them compact.
+    """
+
+    def __init__(self, symsize, gfpoly):
+        """
+        Class constructor (generates the lookup tables of the field).
+
+        :param symsize: Symbol size (bits per symbol, up to 8).
+        :param gfpoly: Galois field generator polynomial.
+
+        :return: None.
+        """
+        self.mm = symsize                   # Bits per symbol
+        self.nn = (1 << symsize) - 1        # Symbols per block (= (1 << mm) - 1)
+        self.alpha_to = bytes()             # Antilog lookup table (doubled length)
+        self.index_of = bytes()             # Log lookup table
+        self.mul_table = bytes()            # Product table, mul_table[(a << mm) | b] = a*b
+        self.primitive = False              # True if gfpoly is a primitive polynomial
+
+        alpha_to = bytearray(2 * self.nn + 1)
+        index_of = bytearray(1 << symsize)
+
+        index_of[0] = self.nn       # log(zero) = -inf
+        sr = 1
+        for i in range(self.nn):
+            index_of[sr] = i
+            alpha_to[i] = sr
+            alpha_to[i + self.nn] = sr
+            sr = sr << 1
+            if (sr & (1 << symsize)):
+                sr = sr ^ gfpoly
+            sr = sr & self.nn
+        if (sr != 1):
+            # field generator polynomial is not primitive!
+            return
+
+        self.alpha_to = bytes(alpha_to)
+        self.index_of = bytes(index_of)
+        self.primitive = True
+
+        mul_table = bytearray(1 << (2 * symsize))
+        for a in range(1, self.nn + 1):
+            log_a = index_of[a]
+            mul_table[(a << symsize) + 1:(a + 1) << symsize] = bytes(alpha_to[log_a + index_of[b]] for b in range(1, self.nn + 1))
+        self.mul_table = bytes(mul_table)
+
+    def __str__(self):
+        """
+        Represents the class as a string.
+
+        :return: a brief description of the class.
+        """
+        return 'Galois field GF(2^' + str(self.mm) + ')'
+
+    def mul_row(self, a):
+        """
+        Gets the products of a given symbol by all the symbols of the field.
+
+        :param a: is the symbol to multiply (poly form).
+
+        :return: The products a*x for every x in the field, indexed by x.
+        """
+        return self.mul_table[a << self.mm:(a + 1) << self.mm]
+
+    def mul_matrix(self):
+        """
+        Gets the product table as a NumPy matrix (read-only view, without copy).
+
+        :return: A 2-D uint8 array with the product of every pair of symbols of the field.
+        """
+        _require_numpy()
+
+        return np.frombuffer(self.mul_table, dtype=np.uint8).reshape(self.nn + 1, self.nn + 1)
+
+class RSCode:
+    """
+    Tables of a Reed-Solomon code (generator polynomial and lookup tables).
+
+    These tables do not depend on the padding of the shortened block, so they are shared (read-only) by all the
+    RS instances with the same code parameters (see get_code()).
+    """
+
+    def __init__(self, symsize, gfpoly, fcr, prim, nroots):
+        """
+        Class constructor (generates the tables of the code).
+
+        :param symsize: Symbol size.
+        :param gfpoly: Galois field polynomial.
+        :param fcr: First consecutive root (index form).
+        :param prim: Primitive element (index form).
+        :param nroots: Number of generator roots (number of parity symbols).
+
+        :return: None.
+        """
+        self.gf = get_field(symsize, gfpoly)   # Galois field arithmetic tables
+        self.nroots = nroots                    # Number of generator roots = number of parity symbols
+        self.genpoly = tuple()                  # Generator polynomial (index form)
+        self.iprim = int()                      # prim-th root of 1, index form
+        self.parity_table = tuple()             # Parity register contribution of each feedback symbol
+        self.syndrome_rows = tuple()            # Multiplication rows of the generator roots, used in the syndromes
+        self.parity_matrix = bytes()            # Systematic parity generator matrix (index form, one row per data symbol)
+        self._parity_products = None            # Products of the parity matrix rows by all symbols (NumPy, generated on demand)
+
+        if not self.gf.primitive:
+            return
+
+        nn = self.gf.nn
+        alpha_to = self.gf.alpha_to
+        index_of = self.gf.index_of
+
+        # Find prim-th root of 1, used in decoding
+        iprim = 1
+        while(1):
+            if (iprim % prim == 0):
+                break
+            iprim = iprim + nn
+        self.iprim = int(iprim / prim)
+
+        genpoly = [0] * (nroots + 1)
+        genpoly[0] = 1
+        root = fcr * prim
+        for i in range(nroots):
+            genpoly[i + 1] = 1
+
+            # Multiply rs->genpoly[] by  @**(root + x)
+            for j in range(i, 0, -1):
+                if (genpoly[j] != 0):
+                    genpoly[j] = genpoly[j - 1] ^ alpha_to[(index_of[genpoly[j]] + root) % nn]
+                else:
+                    genpoly[j] = genpoly[j - 1]
+            # rs->genpoly[0] can never be zero
+            genpoly[0] = alpha_to[(index_of[genpoly[0]] + root) % nn]
+            root = root + prim
+        # convert rs->genpoly[] to index form for quicker encoding
+        self.genpoly = tuple(index_of[x] for x in genpoly)
+
+        # Precompute the contribution of each feedback symbol to the parity register.
+        # The register is packed in a single integer, first parity symbol in the most significant byte
+        parity_table = [0] * (1 << symsize)
+        for i in range(1, 1 << symsize):
+            for j in range(nroots):
+                parity_table[i] = (parity_table[i] << symsize) | alpha_to[index_of[i] + self.genpoly[nroots - 1 - j]]
+        self.parity_table = tuple(parity_table)
+
+        # Multiplication rows of the roots of g(x), the syndromes are evaluated with one lookup per symbol
+        self.syndrome_rows = tuple(self.gf.mul_row(alpha_to[((fcr + i) * prim) % nn]) for i in range(nroots))
+
+        # Parity of each unit message (a 1 in the position i of the full length block), the parity of any message is
+        # the sum of the rows multiplied by the data symbols. The row i is the parity register after shifting a 1
+        # followed by nn - nroots - 1 - i zeros, so the rows are generated from the last one
+        mask = (1 << (symsize * nroots)) - 1
+        rows = [0] * (nn - nroots)
+        parity = 0
+        for i in range(nn - nroots - 1, -1, -1):
+            parity = ((parity << symsize) & mask) ^ parity_table[(1 if i == nn - nroots - 1 else 0) ^ (parity >> (symsize * (nroots - 1)))]
+            rows[i] = parity
+        self.parity_matrix = bytes(index_of[(row >> (symsize * (nroots - 1 - j))) & nn] for row in rows for j in range(nroots))
+
+    def parity_products(self):
+        """
+        Gets the products of each row of the parity generator matrix by all the symbols of the field (requires NumPy).
+
+        The table is generated in the first call. When the number of roots is a multiple of 8, the parity symbols are
+        packed in 64-bit words, so a whole parity row is summed with a few XOR operations.
+
+        :return: A 3-D array indexed by the data position, the data symbol and the (packed) parity symbols.
+        """
+        _require_numpy()
+
+        if self._parity_products is None:
+            nn = self.gf.nn
+
+            # log(0) is mapped to 2*nn, so any product with a zero term falls in the zero part of the extended antilog table
+            alpha_to = np.zeros(4 * nn + 1, dtype=np.uint8)
+            alpha_to[:2 * nn] = np.frombuffer(self.gf.alpha_to, dtype=np.uint8)[:2 * nn]
+            index_of = np.frombuffer(self.gf.index_of, dtype=np.uint8).astype(np.uint16)
+            index_of[0] = 2 * nn
+            matrix = np.frombuffer(self.parity_matrix, dtype=np.uint8).reshape(-1, self.nroots).astype(np.uint16)
+            matrix[matrix == nn] = 2 * nn
+
+            products = alpha_to[index_of[np.newaxis, :, np.newaxis] + matrix[:, np.newaxis, :]]
+            if self.nroots % 8 == 0:
+                products = products.view(np.uint64)
+            products.flags.writeable = False
+
+            self._parity_products = products
+
+        return self._parity_products
+
+def _require_numpy():
+    """
+    Checks if NumPy is available.
+
+    :return: None.
+    """
+    if np is None:
+        raise ImportError('NumPy is required by the batch methods of the Reed-Solomon coding library')
+
+# Galois fields and Reed-Solomon codes already generated in this process
+_GF_CACHE       = dict()
+_RS_CODE_CACHE  = dict()
+
+def get_field(symsize, gfpoly):
+    """
+    Gets the tables of a Galois field, generating them only in the first call with a given configuration.
+
+    :param symsize: Symbol size.
+    :param gfpoly: Galois field polynomial.
+
+    :return: The shared GaloisField object.
+    """
+    key = (symsize, gfpoly)
+    if key not in _GF_CACHE:
+        _GF_CACHE[key] = GaloisField(symsize, gfpoly)
+
+    return _GF_CACHE[key]
+
+def get_code(symsize, gfpoly, fcr, prim, nroots):
+    """
+    Gets the tables of a Reed-Solomon code, generating them only in the first call with a given configuration.
+
+    :param symsize: Symbol size.
+    :param gfpoly: Galois field polynomial.
+    :param fcr: First consecutive root (index form).
+    :param prim: Primitive element (index form).
+    :param nroots: Number of generator roots (number of parity symbols).
+
+    :return: The shared RSCode object.
+    """
+    key = (symsize, gfpoly, fcr, prim, nroots)
+    if key not in _RS_CODE_CACHE:
+        _RS_CODE_CACHE[key] = RSCode(symsize, gfpoly, fcr, prim, nroots)
+
+    return _RS_CODE_CACHE[key]
 
 class RS:
     """
     Reed-Solomon class.
+
+    The field and code tables are shared by all the instances with the same code parameters, so an instance only
+    keeps its own padding.
     """
 
     def __init__(self, symsize, gfpoly, fcr, prim, nroots, pad):
@@ -43,21 +293,13 @@ class RS:
         """
         self._mm = int()                        # Bits per symbol
         self._nn = int()                        # Symbols per block (= (1 << mm) - 1)
-        self._alpha_to = [0] * (1 << symsize)   # log lookup table
-        self._index_of = [0] * (1 << symsize)   # Antilog lookup table
-        self._genpoly = [0] * (nroots + 1)      # Generator polynomial
+        self._code = None                       # Shared tables of the code
         self._nroots = int()                    # Number of generator roots = number of parity symbols
         self._fcr = int()                       # First consecutive root, index form
         self._prim = int()                      # Primitive element, index form
         self._iprim = int()                     # prim-th root of 1, index form
         self._pad = int()                       # Padding bytes in shortened block
 
-        i = int()
-        j = int()
-        sr = int()
-        root = int()
-        iprim = int()
-
         # Check parameter ranges
         if ((symsize < 0) or (symsize > 8)):
             return
@@ -78,50 +320,17 @@ class RS:
         self._nn = (1 << symsize) - 1
         self._pad = pad
 
-        # Generate Galois field lookup tables
-        self._index_of[0] = self._nn    # log(zero) = -inf
-        self._alpha_to[self._nn] = 0    # alpha**-inf = 0
-        sr = 1
-        for i in range(self._nn):
-            self._index_of[sr] = i
-            self._alpha_to[i] = sr
-            sr = sr << 1
-            if (sr & (1 << symsize)):
-                sr = sr ^ gfpoly
-            sr = sr & self._nn
-        if (sr != 1):
+        # Get the (shared) Galois field and generator polynomial tables
+        code = get_code(symsize, gfpoly, fcr, prim, nroots)
+        if not code.gf.primitive:
             # field generator polynomial is not primitive!
             return
 
+        self._code = code
         self._fcr = fcr
         self._prim = prim
         self._nroots = nroots
-
-        # Find prim-th root of 1, used in decoding
-        iprim = 1
-        while(1):
-            if (iprim % prim == 0):
-                break
-            iprim = iprim + self._nn
-        self._iprim = int(iprim / prim)
-
-        self._genpoly[0] = 1
-        root = fcr * prim
-        for i in range(nroots):
-            self._genpoly[i + 1] = 1
-
-            # Multiply rs->genpoly[] by  @**(root + x)
-            for j in range(i, 0, -1):
-                if (self._genpoly[j] != 0):
-                    self._genpoly[j] = self._genpoly[j - 1] ^ self._alpha_to[self._modnn(self._index_of[self._genpoly[j]] + root)]
-                else:
-                    self._genpoly[j] = self._genpoly[j - 1]
-            # rs->genpoly[0] can never be zero
-            self._genpoly[0] = self._alpha_to[self._modnn(self._index_of[self._genpoly[0]] + root)]
-            root = root + prim
-        # convert rs->genpoly[] to index form for quicker encoding
-        for i in range(nroots + 1):
-            self._genpoly[i] = self._index_of[self._genpoly[i]]
+        self._iprim = code.iprim
 
     def __str__(self):
         """
@@ -131,58 +340,193 @@ class RS:
         """
         return 'Reed-Solomon coding library'
 
-    def _modnn(self, x):
+    def encode(self, data):
+        """
+        Encodes a generic byte sequence.
+
+        The parity shift register is kept as a single integer and updated with one lookup in the precomputed
+        parity table for each data symbol.
+
+        :param data: is the data to compute the parity sequence (list of integers).
+
+        :return: The computed parity data.
         """
-        Computes the modulo of a given number.
+        parity = 0
+        parity_table = self._code.parity_table
+        shift = self._mm * (self._nroots - 1)
+        mask = (1 << (self._mm * self._nroots)) - 1
 
-        :param x: is the integer to compute the modulo.
+        for byte in data[:self._nn - self._nroots - self._pad]:
+            parity = ((parity << self._mm) & mask) ^ parity_table[byte ^ (parity >> shift)]
 
-        :return: The computed modulo value of the given number.
+        return [(parity >> (self._mm * (self._nroots - 1 - i))) & self._nn for i in range(self._nroots)]
+
+    def encode_update(self, parity, positions, deltas):
         """
-        while(x >= self._nn):
-            x = x - self._nn
-            x = (x >> self._mm) + (x & self._nn)
+        Updates the parity of a byte sequence after some of its symbols were changed.
 
-        return x;
+        The code is linear, so the new parity is the old parity plus (XOR) the parity of the difference between the
+        old and the new data, which is the sum of the rows of the parity generator matrix of the changed positions.
 
-    def encode(self, data):
+        :param parity: is the parity of the old data (list of integers).
+        :param positions: the positions of the changed symbols in the data (list of index).
+        :param deltas: the difference (XOR) between the old and the new value of each changed symbol (list of integers).
+
+        :return: The parity of the new data.
         """
-        Encodes a generic byte sequence.
+        nn = self._nn
+        nroots = self._nroots
+        alpha_to = self._code.gf.alpha_to
+        index_of = self._code.gf.index_of
+        matrix = self._code.parity_matrix
+
+        parity = list(parity)
+        for pos, delta in zip(positions, deltas):
+            if delta == 0:
+                continue
+            log_delta = index_of[delta]
+            row = (self._pad + pos) * nroots
+            for j in range(nroots):
+                if matrix[row + j] != nn:
+                    parity[j] = parity[j] ^ alpha_to[log_delta + matrix[row + j]]
 
-        :param data: is the data to compute the parity sequence (list of integers).
+        return parity
 
-        :return: The computed parity data.
+    def encode_batch(self, messages):
         """
-        feedback = int()
+        Encodes many byte sequences at once with the systematic parity generator matrix (requires NumPy).
 
-        parity = [0]*self._nroots
+        The parity of each message is the sum (XOR) of the rows of the generator matrix multiplied by the data
+        symbols. The products of each row by all the symbols of the field are precomputed (see
+        RSCode.parity_products()), so each data column costs one lookup and one XOR for all messages in parallel.
+        The result is identical to encode().
 
-        for i in range(self._nn - self._nroots - self._pad):
-            feedback = self._index_of[data[i] ^ parity[0]]
-            if (feedback != self._nn):  # feedback term is non-zero
-                for j in range(self._nroots):
-	                parity[j] = parity[j] ^ self._alpha_to[self._modnn(feedback + self._genpoly[self._nroots - j])]
-            # Shift
-            parity.pop(0)
-            if (feedback != self._nn):
-                parity.append(self._alpha_to[self._modnn(feedback + self._genpoly[0])])
-            else:
-                parity.append(0)
+        :param messages: is a 2-D uint8 array with one message (nn - nroots - pad symbols) per row.
 
-        return parity
+        :return: A 2-D uint8 array with the parity of each message.
+        """
+        _require_numpy()
 
-    def decode(self, data, eras_pos, no_eras):
+        messages = np.asarray(messages, dtype=np.uint8)
+        k = self._nn - self._nroots - self._pad
+        if (messages.ndim != 2) or (messages.shape[1] != k):
+            raise ValueError('The messages must be a 2-D array with ' + str(k) + ' columns')
+
+        products = self._code.parity_products()[self._pad:]
+
+        parity = np.zeros((messages.shape[0], products.shape[2]), dtype=products.dtype)
+        for i in range(k):
+            parity ^= products[i][messages[:, i]]
+
+        return parity.view(np.uint8)
+
+    def syndromes(self, data):
+        """
+        Computes the syndromes of a Reed-Solomon coded byte sequence.
+
+        :param data: is the data to check (data + parity, list of integers).
+
+        :return: The syndromes in poly form (all zero if the data is a valid codeword).
+        """
+        s = [0] * self._nroots
+
+        # Evaluate data(x) at roots of g(x) (Horner's rule, one lookup per symbol)
+        codeword = data[:self._nn - self._pad]
+        for i in range(self._nroots):
+            row = self._code.syndrome_rows[i]
+            tmp = 0
+            for byte in codeword:
+                tmp = row[tmp] ^ byte
+            s[i] = tmp
+
+        return s
+
+    def syndromes_batch(self, codewords):
+        """
+        Computes the syndromes of many Reed-Solomon coded byte sequences at once (requires NumPy).
+
+        :param codewords: is a 2-D uint8 array with one codeword (data + parity) per row.
+
+        :return: The syndromes of each row in poly form and a mask with the rows without errors.
+        """
+        _require_numpy()
+
+        codewords = np.asarray(codewords, dtype=np.uint8)
+        if (codewords.ndim != 2) or (codewords.shape[1] != self._nn - self._pad):
+            raise ValueError('The codewords must be a 2-D array with ' + str(self._nn - self._pad) + ' columns')
+
+        mul = self._code.gf.mul_matrix()
+        roots = np.array([row[1] for row in self._code.syndrome_rows], dtype=np.uint8)
+
+        # Horner's rule over the columns, for all rows and roots in parallel
+        s = np.zeros((codewords.shape[0], self._nroots), dtype=np.uint8)
+        for j in range(codewords.shape[1]):
+            s = mul[s, roots] ^ codewords[:, j, np.newaxis]
+
+        return s, ~s.any(axis=1)
+
+    def decode(self, data, eras_pos, no_eras, shortened=False, vectorized=False):
         """
         Decode a Reed-Solomon coded byte sequence.
 
         :param data: is the data to decode (data + parity, list of integers).
-        :param eras_pos: the error positions (list of index).
-        :param no_eras: the number of errors.
+        :param eras_pos: the positions of the known erroneous symbols (erasures), in the same coordinates of the returned error positions (index in data + pad).
+        :param no_eras: the number of erasures (0 to nroots, the first no_eras items of eras_pos are used).
+        :param shortened: if True, the roots of the error locator are only searched in the transmitted positions of the shortened block, and locators with more roots than the code can correct are rejected before the search (default False).
+        :param vectorized: if True, the error locator and evaluator polynomials are evaluated in all the candidate positions at once with NumPy (default False).
+
+        :return: The corrected data (if applicable), the number of corrected symbols (errors + erasures, -1 if uncorrectable) and the error positions (index in data + pad).
+        """
+        if vectorized:
+            _require_numpy()
+
+        return self._correct(data, self.syndromes(data), eras_pos, no_eras, shortened, vectorized)
+
+    def decode_batch(self, codewords, shortened=False, vectorized=False):
+        """
+        Decodes many Reed-Solomon coded byte sequences at once (requires NumPy).
+
+        The syndromes of all the codewords are computed in a single vectorized pass, and only the codewords with
+        errors go through the error correction.
+
+        :param codewords: is a 2-D uint8 array with one codeword (data + parity) per row.
+        :param shortened: if True, uses the shortened block Chien search (see decode()).
+        :param vectorized: if True, uses the NumPy Chien search and Forney algorithm (see decode()).
+
+        :return: The corrected codewords (a new 2-D uint8 array), the number of detected errors of each row (-1 if uncorrectable) and the error positions of each row.
+        """
+        s, clean = self.syndromes_batch(codewords)
+
+        data = np.array(codewords, dtype=np.uint8)
+        counts = np.zeros(data.shape[0], dtype=int)
+        positions = [list() for i in range(data.shape[0])]
+
+        for i in np.flatnonzero(~clean):
+            cw, counts[i], positions[i] = self._correct(bytearray(data[i].tobytes()), s[i].tolist(), [0], 0, shortened, vectorized)
+            data[i] = np.frombuffer(cw, dtype=np.uint8)
+
+        return data, counts, positions
+
+    def _correct(self, data, s, eras_pos, no_eras, shortened=False, vectorized=False):
+        """
+        Corrects a Reed-Solomon coded byte sequence from its syndromes.
+
+        :param data: is the data to correct (data + parity, list of integers or bytearray).
+        :param s: the syndromes of the data (poly form).
+        :param eras_pos: the erasure positions (index in data + pad).
+        :param no_eras: the number of erasures.
+        :param shortened: if True, uses the shortened block Chien search (see decode()).
+        :param vectorized: if True, uses the NumPy Chien search and Forney algorithm (see decode()).
 
         :return: The corrected data (if applicable), the number of detected errors and the error positions.
         """
         retval = -1
 
+        nn = self._nn
+        nroots = self._nroots
+        alpha_to = self._code.gf.alpha_to
+        index_of = self._code.gf.index_of
+
         deg_lambda = int()
         el = int()
         deg_omega = int()
@@ -193,114 +537,96 @@ class RS:
         num2 = int()
         den = int()
         discr_r = int()
-        _lambda = [0] * (self._nroots + 1)    # Err+Eras Locator poly and syndrome poly
-        s = [0] * self._nroots
-        b = [0] * (self._nroots + 1)
-        t = [0] * (self._nroots + 1)
-        omega = [0] * (self._nroots + 1)
-        root = [0] * self._nroots
-        reg = [0] * (self._nroots + 1)
-        loc = [0] * self._nroots
+        _lambda = [0] * (nroots + 1)    # Err+Eras Locator poly and syndrome poly
+        s = list(s)
+        b = [0] * (nroots + 1)
+        t = [0] * (nroots + 1)
+        omega = [0] * (nroots + 1)
+        root = list()
+        loc = list()
         syn_error = int()
         count = int()
 
-        # form the syndromes; i.e., evaluate data(x) at roots of g(x)
-        for i in range(self._nroots):
-            s[i] = data[0]
-
-        for j in range(1, self._nn - self._pad):
-            for i in range(self._nroots):
-                if (s[i] == 0):
-                    s[i] = data[j]
-                else:
-                    s[i] = data[j] ^ self._alpha_to[self._modnn(self._index_of[s[i]] + (self._fcr + i) * self._prim)]
-
         # Convert syndromes to index form, checking for nonzero condition
         syn_error = 0
-        for i in range(self._nroots):
+        for i in range(nroots):
             syn_error = syn_error | s[i]
-            s[i] = self._index_of[s[i]]
+            s[i] = index_of[s[i]]
 
         if (not syn_error):
             # if syndrome is zero, data[] is a codeword and there are no errors to correct. So return data[] unmodified
             count = 0;
+        elif (no_eras > nroots):
+            # More erasures than parity symbols => uncorrectable
+            count = -1
         else:
             _lambda[0] = 1
 
             if (no_eras > 0):
                 # Init lambda to be the erasure locator polynomial
-                _lambda[1] = self._alpha_to[self._modnn(self._prim * (self._nn - 1 - eras_pos[0]))]
+                _lambda[1] = alpha_to[(self._prim * (nn - 1 - eras_pos[0])) % nn]
                 for i in range(1, no_eras):
-                    u = self._modnn(self._prim * (self._nn - 1 - eras_pos[i]))
+                    u = (self._prim * (nn - 1 - eras_pos[i])) % nn
                     for j in range(i + 1, 0, -1):
-                        tmp = self._index_of[_lambda[j - 1]]
-                        if (tmp != self._nn):
-                            _lambda[j] = _lambda[j] ^ seld_.alpha_to[self._modnn(u + tmp)]
-            for i in range(self._nroots + 1):
-                b[i] = self._index_of[_lambda[i]]
+                        tmp = index_of[_lambda[j - 1]]
+                        if (tmp != nn):
+                            _lambda[j] = _lambda[j] ^ alpha_to[u + tmp]
+            for i in range(nroots + 1):
+                b[i] = index_of[_lambda[i]]
 
             # Begin Berlekamp-Massey algorithm to determine error+erasure locator polynomial
             r = no_eras + 1
             el = no_eras
-            while(r <= self._nroots):   # r is the step number
+            while(r <= nroots):   # r is the step number
                 # Compute discrepancy at the r-th step in poly-form
                 discr_r = 0
                 for i in range(r):
-                    if ((_lambda[i] != 0) and (s[r - i - 1] != self._nn)):
-                        discr_r = discr_r ^ self._alpha_to[self._modnn(self._index_of[_lambda[i]] + s[r - i - 1])]
-                discr_r = self._index_of[discr_r]   # Index form
-                if (discr_r == self._nn):
-                    # 2 lines below: B(x) <-- x*B(x)
-                    b.insert(0, self._nn)
+                    if ((_lambda[i] != 0) and (s[r - i - 1] != nn)):
+                        discr_r = discr_r ^ alpha_to[index_of[_lambda[i]] + s[r - i - 1]]
+                discr_r = index_of[discr_r]   # Index form
+                if (discr_r == nn):
+                    # B(x) <-- x*B(x)
+                    b = [nn] + b[:nroots]
                 else:
                     # 7 lines below: T(x) <-- lambda(x) - discr_r*x*b(x)
                     t[0] = _lambda[0]
-                    for i in range(self._nroots):
-                        if (b[i] != self._nn):
-                            t[i + 1] = _lambda[i + 1] ^ self._alpha_to[self._modnn(discr_r + b[i])]
+                    for i in range(nroots):
+                        if (b[i] != nn):
+                            t[i + 1] = _lambda[i + 1] ^ alpha_to[discr_r + b[i]]
                         else:
                             t[i + 1] = _lambda[i + 1]
                     if (2 * el <= r + no_eras - 1):
                         el = r + no_eras - el
                         # 2 lines below: B(x) <-- inv(discr_r) * lambda(x)
-                        for i in range(self._nroots + 1):
+                        for i in range(nroots + 1):
                             if (_lambda[i] == 0):
-                                b[i] = self._nn
+                                b[i] = nn
                             else:
-                                b[i] = self._modnn(self._index_of[_lambda[i]] - discr_r + self._nn)
+                                b[i] = index_of[_lambda[i]] - discr_r + nn
+                                if (b[i] >= nn):
+                                    b[i] = b[i] - nn
                     else:
-                        # 2 lines below: B(x) <-- x*B(x)
-                        b.insert(0, self._nn)
-                    _lambda = t[:self._nroots + 1]
+                        # B(x) <-- x*B(x)
+                        b = [nn] + b[:nroots]
+                    _lambda = t[:nroots + 1]
                 r = r + 1
 
             # Convert lambda to index form and compute deg(lambda(x))
             deg_lambda = 0
-            for i in range(self._nroots + 1):
-                _lambda[i] = self._index_of[_lambda[i]]
-                if (_lambda[i] != self._nn):
+            for i in range(nroots + 1):
+                _lambda[i] = index_of[_lambda[i]]
+                if (_lambda[i] != nn):
                     deg_lambda = i
             # Find roots of the error+erasure locator polynomial by Chien search
-            reg[1:] = _lambda[1:self._nroots + 1]
-            count = 0   # Number of roots of _lambda(x)
-            k = self._iprim - 1
-            for i in range(1, self._nn + 1):
-                q = 1   # lambda[0] is always 0
-                for j in range(deg_lambda, 0, -1):
-                    if (reg[j] != self._nn):
-                        reg[j] = self._modnn(reg[j] + j)
-                        q = q ^ self._alpha_to[reg[j]]
-                if (q != 0):
-                    k = self._modnn(k + self._iprim)
-                    continue    # Not a root
-                # store root (index-form) and error location number
-                root[count] = i
-                loc[count] = k
-                # If we've already found max possible roots, abort the search to save time
-                count = count + 1
-                if (count == deg_lambda):
-                    break
-                k = self._modnn(k + self._iprim)
+            if shortened and ((deg_lambda == 0) or (2 * deg_lambda - no_eras > nroots)):
+                # The locator polynomial has more roots than the code can correct, no need to search them
+                root, loc, count = list(), list(), -1
+            elif vectorized:
+                root, loc, count = self._chien_search_vectorized(_lambda, deg_lambda, shortened)
+            elif not shortened:
+                root, loc, count = self._chien_search(_lambda, deg_lambda)
+            else:
+                root, loc, count = self._chien_search_shortened(_lambda, deg_lambda)
             if (deg_lambda != count):
                 # deg(lambda) unequal to number of roots => uncorrectable error detected
                 count = -1
@@ -310,26 +636,29 @@ class RS:
                 for i in range(deg_omega + 1):
                     tmp = 0
                     for j in range(i, -1, -1):
-                        if ((s[i - j] != self._nn) and (_lambda[j] != self._nn)):
-                            tmp = tmp ^ self._alpha_to[self._modnn(s[i - j] + _lambda[j])]
-                    omega[i] = self._index_of[tmp]
-
-                # Compute error values in poly-form. num1 = omega(inv(X(l))), num2 = inv(X(l))**(rs.fcr-1) and den = lambda_pr(inv(X(l))) all in poly-form
-                for j in range(count - 1, -1, -1):
-                    num1 = 0
-                    for i in range(deg_omega, -1, -1):
-                        if (omega[i] != self._nn):
-                            num1 = num1 ^ self._alpha_to[self._modnn(omega[i] + i * root[j])]
-                    num2 = self._alpha_to[self._modnn(root[j] * (self._fcr - 1) + self._nn)]
-                    den = 0
-
-                    # lambda[i+1] for i even is the formal derivative lambda_pr of lambda[i]
-                    for i in range(min(deg_lambda, self._nroots - 1) & ~1, -1, -2):
-                        if (_lambda[i + 1] != self._nn):
-                            den = den ^ self._alpha_to[self._modnn(_lambda[i + 1] + i * root[j])]
-                    # Apply error to data
-                    if (num1 != 0 and loc[j] >= self._pad):
-                        data[loc[j] - self._pad] = data[loc[j] - self._pad] ^ self._alpha_to[self._modnn(self._index_of[num1] + self._index_of[num2] + self._nn - self._index_of[den])]
+                        if ((s[i - j] != nn) and (_lambda[j] != nn)):
+                            tmp = tmp ^ alpha_to[s[i - j] + _lambda[j]]
+                    omega[i] = index_of[tmp]
+
+                if vectorized:
+                    self._forney_vectorized(data, omega, deg_omega, _lambda, deg_lambda, root, loc)
+                else:
+                    # Compute error values in poly-form. num1 = omega(inv(X(l))), num2 = inv(X(l))**(rs.fcr-1) and den = lambda_pr(inv(X(l))) all in poly-form
+                    for j in range(count - 1, -1, -1):
+                        num1 = 0
+                        for i in range(deg_omega, -1, -1):
+                            if (omega[i] != nn):
+                                num1 = num1 ^ alpha_to[(omega[i] + i * root[j]) % nn]
+                        num2 = alpha_to[(root[j] * (self._fcr - 1)) % nn]
+                        den = 0
+
+                        # lambda[i+1] for i even is the formal derivative lambda_pr of lambda[i]
+                        for i in range(min(deg_lambda, nroots - 1) & ~1, -1, -2):
+                            if (_lambda[i + 1] != nn):
+                                den = den ^ alpha_to[(_lambda[i + 1] + i * root[j]) % nn]
+                        # Apply error to data
+                        if (num1 != 0 and loc[j] >= self._pad):
+                            data[loc[j] - self._pad] = data[loc[j] - self._pad] ^ alpha_to[(index_of[num1] + index_of[num2] + nn - index_of[den]) % nn]
 
         if (eras_pos != None):
             eras_pos = [0] * count
@@ -338,3 +667,266 @@ class RS:
         retval = count
 
         return data, retval, eras_pos
+
+    def _chien_search(self, _lambda, deg_lambda):
+        """
+        Finds the roots of the error locator polynomial in all the positions of the field (Chien search).
+
+        :param _lambda: the error locator polynomial (index form).
+        :param deg_lambda: the degree of the error locator polynomial.
+
+        :return: The roots (index form), the error locations and the number of roots found.
+        """
+        nn = self._nn
+        alpha_to = self._code.gf.alpha_to
+
+        reg = list(_lambda)
+        root = list()
+        loc = list()
+        count = 0   # Number of roots of _lambda(x)
+        k = self._iprim - 1
+        for i in range(1, nn + 1):
+            q = 1   # lambda[0] is always 0
+            for j in range(deg_lambda, 0, -1):
+                if (reg[j] != nn):
+                    reg[j] = reg[j] + j
+                    if (reg[j] >= nn):
+                        reg[j] = reg[j] - nn
+                    q = q ^ alpha_to[reg[j]]
+            if (q != 0):
+                k = (k + self._iprim) % nn
+                continue    # Not a root
+            # store root (index-form) and error location number
+            root.append(i)
+            loc.append(k)
+            # If we've already found max possible roots, abort the search to save time
+            count = count + 1
+            if (count == deg_lambda):
+                break
+            k = (k + self._iprim) % nn
+
+        return root, loc, count
+
+    def _chien_search_shortened(self, _lambda, deg_lambda):
+        """
+        Finds the roots of the error locator polynomial only in the transmitted positions of the shortened block.
+
+        The error location k is the root i = (k + 1)*prim (modulo nn), so only the positions from pad to nn - 1 are
+        evaluated. The roots are returned in the same order of the full search.
+
+        :param _lambda: the error locator polynomial (index form).
+        :param deg_lambda: the degree of the error locator polynomial.
+
+        :return: The roots (index form), the error locations and the number of roots found.
+        """
+        nn = self._nn
+        alpha_to = self._code.gf.alpha_to
+
+        terms = [(j, _lambda[j]) for j in range(1, deg_lambda + 1) if _lambda[j] != nn]
+        found = list()
+        for k in range(self._pad, nn):
+            # Not enough positions left for the missing roots
+            if (nn - k < deg_lambda - len(found)):
+                break
+            i = ((k + 1) * self._prim) % nn
+            q = 1   # lambda[0] is always 0
+            for j, lambda_j in terms:
+                q = q ^ alpha_to[(lambda_j + j * i) % nn]
+            if (q == 0):
+                found.append((i if i != 0 else nn, k))
+                if (len(found) == deg_lambda):
+                    break
+        found.sort()
+
+        return [i for i, k in found], [k for i, k in found], len(found)
+
+    def _chien_search_vectorized(self, _lambda, deg_lambda, shortened=False):
+        """
+        Finds the roots of the error locator polynomial evaluating it in all the candidate positions at once (NumPy).
+
+        :param _lambda: the error locator polynomial (index form).
+        :param deg_lambda: the degree of the error locator polynomial.
+        :param shortened: if True, only the transmitted positions of the shortened block are evaluated.
+
+        :return: The roots (index form), the error locations and the number of roots found.
+        """
+        nn = self._nn
+        alpha_to = np.frombuffer(self._code.gf.alpha_to, dtype=np.uint8)
+
+        # Error locations and the corresponding roots, i = (k + 1)*prim (modulo nn)
+        k = np.arange(self._pad if shortened else 0, nn)
+        i = ((k + 1) * self._prim) % nn
+        i[i == 0] = nn
+
+        j = np.array([j for j in range(1, deg_lambda + 1) if _lambda[j] != nn], dtype=int)
+        lambda_j = np.array([_lambda[x] for x in j], dtype=int)
+
+        # lambda(alpha**i) for every candidate root (lambda[0] is always 0, index form)
+        q = np.bitwise_xor.reduce(alpha_to[(lambda_j[:, np.newaxis] + j[:, np.newaxis] * i) % nn], axis=0) ^ 1 if len(j) > 0 else np.ones(len(i), dtype=np.uint8)
+
+        found = np.flatnonzero(q == 0)
+        found = found[np.argsort(i[found], kind='stable')]
+
+        return i[found].tolist(), k[found].tolist(), len(found)
+
+    def _forney_vectorized(self, data, omega, deg_omega, _lambda, deg_lambda, root, loc):
+        """
+        Computes the error values of all the error locations at once (Forney algorithm, NumPy) and applies them to the data.
+
+        :param data: is the data to correct (data + parity, list of integers or bytearray).
+        :param omega: the error evaluator polynomial (index form).
+        :param deg_omega: the degree of the error evaluator polynomial.
+        :param _lambda: the error locator polynomial (index form).
+        :param deg_lambda: the degree of the error locator polynomial.
+        :param root: the roots of the error locator polynomial (index form).
+        :param loc: the error locations.
+
+        :return: None.
+        """
+        nn = self._nn
+        alpha_to = np.frombuffer(self._code.gf.alpha_to, dtype=np.uint8)
+        index_of = np.frombuffer(self._code.gf.index_of, dtype=np.uint8).astype(int)
+
+        root = np.array(root, dtype=int)
+
+        # num1 = omega(inv(X(l)))
+        i = np.array([i for i in range(deg_omega + 1) if omega[i] != nn], dtype=int)
+        omega_i = np.array([omega[x] for x in i], dtype=int)
+        num1 = np.bitwise_xor.reduce(alpha_to[(omega_i[:, np.newaxis] + i[:, np.newaxis] * root) % nn], axis=0) if len(i) > 0 else np.zeros(len(root), dtype=np.uint8)
+
+        # num2 = inv(X(l))**(fcr-1)
+        num2 = alpha_to[(root * (self._fcr - 1)) % nn]
+
+        # den = lambda_pr(inv(X(l))), lambda[i+1] for i even is the formal derivative lambda_pr of lambda[i]
+        i = np.array([i for i in range(min(deg_lambda, self._nroots - 1) & ~1, -1, -2) if _lambda[i + 1] != nn], dtype=int)
+        lambda_i = np.array([_lambda[x + 1] for x in i], dtype=int)
+        den = np.bitwise_xor.reduce(alpha_to[(lambda_i[:, np.newaxis] + i[:, np.newaxis] * root) % nn], axis=0) if len(i) > 0 else np.zeros(len(root), dtype=np.uint8)
+
+        err = alpha_to[(index_of[num1] + index_of[num2] + nn - index_of[den]) % nn]
+
+        # Apply error to data
+        for j in range(len(root)):
+            if (num1[j] != 0 and loc[j] >= self._pad):
+                data[loc[j] - self._pad] = data[loc[j] - self._pad] ^ int(err[j])
+
+class RSNumPy(RS):
+    """
+    Reed-Solomon class with the NumPy error locator evaluation and Forney algorithm.
+
+    The encoding and the results of the decoding are identical to the RS class (reference backend).
+    """
+
+    def __init__(self, symsize, gfpoly, fcr, prim, nroots, pad):
+        """
+        Class constructor (Reed-Solomon coding configuration, see RS).
+
+        :return: None.
+        """
+        _require_numpy()
+
+        super().__init__(symsize, gfpoly, fcr, prim, nroots, pad)
+
+    def __str__(self):
+        """
+        Represents the class as a string.
+
+        :return: a brief description of the class.
+        """
+        return 'Reed-Solomon coding library (NumPy)'
+
+    def decode(self, data, eras_pos, no_eras, shortened=False, vectorized=True):
+        """
+        Decode a Reed-Solomon coded byte sequence (see RS.decode(), vectorized by default).
+
+        :return: The corrected data (if applicable), the number of corrected symbols and the error positions.
+        """
+        return super().decode(data, eras_pos, no_eras, shortened, vectorized)
+
+# Reed-Solomon backends, "python" is the reference implementation
+_RS_BACKENDS            = {'python': RS, 'numpy': RSNumPy}
+_RS_BACKENDS_CHECKED    = dict()
+
+# Environment variable to select the backend (python, numpy, auto or any other registered backend)
+_RS_BACKEND_ENV         = 'PYNGHAM_RS_BACKEND'
+
+def register_backend(name, backend):
+    """
+    Registers a new Reed-Solomon backend.
+
+    :param name: is the name of the backend.
+    :param backend: is the backend class, with the same constructor, encode() and decode() of the RS class.
+
+    :return: None.
+    """
+    _RS_BACKENDS[name] = backend
+    _RS_BACKENDS_CHECKED.pop(name, None)
+
+def check_backend(backend, trials=10):
+    """
+    Checks if a Reed-Solomon backend gives the same results of the reference backend (RS class).
+
+    Random frames of the two NGHam code sizes are encoded and decoded with random errors, with and without the
+    shortened block search.
+
+    :param backend: is the backend class to check.
+    :param trials: is the number of random frames of each configuration.
+
+    :return: True/False if the backend matches the reference or not.
+    """
+    rnd = random.Random(0)
+
+    for nroots, pad in [(16, 208), (16, 144), (32, 96), (32, 0)]:
+        ref = RS(8, 0x187, 112, 11, nroots, pad)
+        rsc = backend(8, 0x187, 112, 11, nroots, pad)
+        n = 255 - pad
+
+        for i in range(trials):
+            data = [rnd.randrange(256) for j in range(n - nroots)]
+            parity = ref.encode(data)
+            if list(rsc.encode(data)) != parity:
+                return False
+
+            cw = data + parity
+            for pos in rnd.sample(range(n), rnd.randrange(nroots)):
+                cw[pos] = cw[pos] ^ rnd.randrange(1, 256)
+
+            for shortened in [False, True]:
+                if rsc.decode(list(cw), [0], 0, shortened) != ref.decode(list(cw), [0], 0, shortened):
+                    return False
+
+    return True
+
+def get_backend(name=None):
+    """
+    Gets a Reed-Solomon backend.
+
+    The backend is checked against the reference backend (see check_backend()) in the first time it is selected.
+    The "auto" backend is the NumPy backend, or the reference backend when NumPy is not available or fails the
+    check.
+
+    :param name: is the name of the backend (python, numpy or auto). If None, the environment variable PYNGHAM_RS_BACKEND is used (default auto).
+
+    :return: The backend class.
+    """
+    if name is None:
+        name = os.environ.get(_RS_BACKEND_ENV, 'auto')
+
+    if name == 'auto':
+        if np is None:
+            return RS
+
+        try:
+            return get_backend('numpy')
+        except RuntimeError:
+            return RS
+
+    if name not in _RS_BACKENDS:
+        raise ValueError('Unknown Reed-Solomon backend: ' + str(name))
+
+    if name not in _RS_BACKENDS_CHECKED:
+        _RS_BACKENDS_CHECKED[name] = check_backend(_RS_BACKENDS[name])
+
+    if not _RS_BACKENDS_CHECKED[name]:
+        raise RuntimeError('The Reed-Solomon backend ' + str(name) + ' does not match the reference backend')
+
+    return _RS_BACKENDS[name]
@@ -0,0 +1,191 @@
+#
+# scheduler.py
+#
+# Copyright (C) 2023, Gabriel Mariano Marcelino - PU5GMA <gabriel.mm8@gmail.com>
+#
+# This file is part of PyNGHam library.
+#
+# PyNGHam library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# PyNGHam library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with PyNGHam library. If not, see <http://www.gnu.org/licenses/>.
+#
+#
+
+
+import time
+
+from pyngham.pyngham import PyNGHam, _PYNGHAM_PL_SIZES, _payload_bytes
+
+class PyNGHamScheduler:
+    """
+    Frame aggregation scheduler.
+
+    Extension packets are queued with a deadline and packed together into NGHam payloads, using the fewest frames
+    and the smallest size classes (28 to 220 bytes) possible. Raw payloads (not framed as extension packets) are
+    always transmitted alone, in their own frame.
+    """
+
+    def __init__(self, ngham=None, flags=0):
+        """
+        Constructor.
+
+        :param ngham: NGHam encoder used to generate the frames. If None, a new one is created with the default parameters.
+        :type ngham: PyNGHam, optional
+
+        :param flags: Flags of the generated NGHam packets, default 0.
+        :type flags: int, optional
+
+        :return: None.
+        :rtype: None
+        """
+        if ngham is None:
+            ngham = PyNGHam()
+
+        self._ngham = ngham
+        self._flags = flags
+        self._queue = list()    # Items as (deadline, sequence, data, raw)
+        self._seq = 0
+
+    def __len__(self):
+        """
+        Gets the number of queued items.
+
+        :return: The number of extension packets and raw payloads waiting to be transmitted.
+        :rtype: int
+        """
+        return len(self._queue)
+
+    def add(self, pkt, deadline=None, raw=False):
+        """
+        Adds an extension packet (or a raw payload) to the transmission queue.
+
+        :param pkt: Extension packet (type, length and data, as generated by PyNGHamExtension.append_pkt with an empty payload) or raw payload.
+        :type pkt: list[int], bytes, bytearray or str
+
+        :param deadline: Time limit to transmit the item (same time base of the "now" argument of schedule, by default time.monotonic()). If None, the item is only transmitted to fill a frame or when the queue is flushed.
+        :type deadline: float, optional
+
+        :param raw: If True, the item is a raw payload and is not packed with other items, default False.
+        :type raw: bool, optional
+
+        :return: None.
+        :rtype: None
+        """
+        data = bytes(_payload_bytes(pkt))
+
+        if (len(data) == 0) or (len(data) > _PYNGHAM_PL_SIZES[-1]):
+            raise ValueError('Items must have between 1 and ' + str(_PYNGHAM_PL_SIZES[-1]) + ' bytes (got ' + str(len(data)) + ')')
+
+        if (not raw) and ((len(data) < 2) or (data[1] != len(data) - 2)):
+            raise ValueError('Invalid extension packet (the length field does not match the size of the data)')
+
+        if deadline is None:
+            deadline = float('inf')
+
+        self._queue.append((deadline, self._seq, data, raw))
+        self._seq = self._seq + 1
+
+    def schedule(self, now=None, flush=False):
+        """
+        Packs the items to transmit into NGHam payloads.
+
+        All items with expired deadline (or all items, if flush is True) are packed using a best-fit decreasing
+        strategy. After that, the remaining space of the size class of each frame is filled with other queued
+        extension packets (earliest deadlines first, never raw payloads), without increasing the size class. Items not
+        packed stay in the queue.
+
+        :param now: Current time. If None, time.monotonic() is used.
+        :type now: float, optional
+
+        :param flush: If True, all queued items are transmitted, default False.
+        :type flush: bool, optional
+
+        :return: A list of payloads, sorted by the earliest deadline of its items.
+        :rtype: list[bytes]
+        """
+        if now is None:
+            now = time.monotonic()
+
+        self._queue.sort()
+
+        due = [it for it in self._queue if flush or (it[0] <= now)]
+        if len(due) == 0:
+            return list()
+
+        pending = [it for it in self._queue if not (flush or (it[0] <= now))]
+
+        frames = [[len(it[2]), [it]] for it in due if it[3]]
+
+        # Best-fit decreasing of the extension packets
+        bins = list()
+        for it in sorted([it for it in due if not it[3]], key=lambda x: len(x[2]), reverse=True):
+            best = None
+            for b in bins:
+                if (b[0] + len(it[2]) <= _PYNGHAM_PL_SIZES[-1]) and ((best is None) or (b[0] > best[0])):
+                    best = b
+
+            if best is None:
+                best = [0, list()]
+                bins.append(best)
+
+            best[0] = best[0] + len(it[2])
+            best[1].append(it)
+
+        # Fill the unused space of the size class of each frame
+        for b in bins:
+            capacity = self._size_class(b[0])
+
+            for it in list(pending):
+                if (not it[3]) and (b[0] + len(it[2]) <= capacity):
+                    b[0] = b[0] + len(it[2])
+                    b[1].append(it)
+                    pending.remove(it)
+
+        self._queue = pending
+
+        frames = frames + bins
+        for f in frames:
+            f[1].sort()
+        frames.sort(key=lambda f: f[1][0][:2])
+
+        return [b''.join([it[2] for it in f[1]]) for f in frames]
+
+    def encode(self, now=None, flush=False):
+        """
+        Packs the items to transmit and encodes them as NGHam packets.
+
+        :param now: Current time. If None, time.monotonic() is used.
+        :type now: float, optional
+
+        :param flush: If True, all queued items are transmitted, default False.
+        :type flush: bool, optional
+
+        :return: A list of encoded NGHam packets (see the schedule method).
+        :rtype: list[bytes]
+        """
+        return [self._ngham.encode_bytes(pl, self._flags) for pl in self.schedule(now, flush)]
+
+    def _size_class(self, n):
+        """
+        Gets the smallest NGHam payload size able to hold a given number of bytes.
+
+        :param n: Number of bytes.
+        :type n: int
+
+        :return: The payload size of the smallest size class.
+        :rtype: int
+        """
+        for size in _PYNGHAM_PL_SIZES:
+            if n <= size:
+                return size
+
+        return _PYNGHAM_PL_SIZES[-1]
@@ -23,7 +23,7 @@
 
 from enum import Enum
 import time
-from crc import Calculator, Configuration
+from pyngham.crc16 import crc16
 
 class SPPType(Enum):
     """
@@ -121,7 +121,7 @@ class PyNGHamSPP:
         # Payload
         pkt = pkt + pl
 
-        crc_val = Calculator(Configuration(16, 0x1021, 0xFFFF, 0xFFFF, True, True)).checksum(bytes(pkt))
+        crc_val = crc16(pkt)
         checksum = [(crc_val >> 8) & 0xFF, crc_val & 0xFF]
 
         # Start byte and CRC
@@ -306,7 +306,7 @@ class PyNGHamSPP:
 			# If received length has met target length (set in STATE_HEADER)
             if len(self._rx_buffer) == (2 + 1 + 1 + self._rx_buffer[3]):
                 # Check checksum
-                crc_val = Calculator(Configuration(16, 0x1021, 0xFFFF, 0xFFFF, True, True)).checksum(bytes(self._rx_buffer[2:]))
+                crc_val = crc16(self._rx_buffer[2:])
 
                 self._state = SPPState.START
 
@@ -0,0 +1,108 @@
+#
+# symbols.py
+# 
+# Copyright (C) 2023, Gabriel Mariano Marcelino - PU5GMA <gabriel.mm8@gmail.com>
+# 
+# This file is part of PyNGHam library.
+# 
+# PyNGHam library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# 
+# PyNGHam library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+# 
+# You should have received a copy of the GNU Lesser General Public License
+# along with PyNGHam library. If not, see <http://www.gnu.org/licenses/>.
+# 
+#
+
+
+try:
+    import numpy as np
+except ImportError:     # NumPy is required by all the functions of this module
+    np = None
+
+# Two level symbols of the bits 0 and 1
+_PYNGHAM_SYMBOLS_TWO_LEVEL      = [-1, +1]
+
+# Four level symbols of the dibits 00, 01, 10 and 11 (Gray coded, the preamble 0xDD alternates between -3 and +3)
+_PYNGHAM_SYMBOLS_FOUR_LEVEL     = [+1, +3, -1, -3]
+
+# Dibits of the four levels in ascending order (-3, -1, +1, +3) and the decision thresholds between them
+_PYNGHAM_DIBITS_FOUR_LEVEL      = [0b11, 0b10, 0b00, 0b01]
+_PYNGHAM_THRESHOLDS_FOUR_LEVEL  = [-2, 0, 2]
+
+def _require_numpy():
+    """
+    Checks if NumPy is available.
+
+    :return: None.
+    :rtype: None
+    """
+    if np is None:
+        raise ImportError('NumPy is required to convert bytes to symbols')
+
+def bytes_to_symbols(data, mod=0):
+    """
+    Maps a sequence of bytes to a stream of two or four level symbols (most significant bit first).
+
+    The two level symbols are -1 (bit 0) and +1 (bit 1). The four level symbols are +1 (00), +3 (01), -1 (10) and
+    -3 (11).
+
+    :param data: Bytes to map. A 2-D uint8 array is mapped row by row (a batch of packets with the same size).
+    :type data: bytes, bytearray, list[int] or numpy.ndarray
+
+    :param mod: Modulation type (two=0 or four level=1, default 0).
+    :type mod: int, optional
+
+    :return: The symbols (8 per byte for the two level modulation, 4 per byte for the four level modulation).
+    :rtype: numpy.ndarray (int8)
+    """
+    _require_numpy()
+
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = np.frombuffer(data, dtype=np.uint8)
+    else:
+        data = np.asarray(data, dtype=np.uint8)
+
+    if mod == 0:
+        bits = np.unpackbits(data, axis=-1)
+
+        return np.array(_PYNGHAM_SYMBOLS_TWO_LEVEL, dtype=np.int8)[bits]
+    else:
+        dibits = np.stack(((data >> 6) & 3, (data >> 4) & 3, (data >> 2) & 3, data & 3), axis=-1)
+
+        return np.array(_PYNGHAM_SYMBOLS_FOUR_LEVEL, dtype=np.int8)[dibits.reshape(data.shape[:-1] + (-1,))]
+
+def symbols_to_bytes(symbols, mod=0):
+    """
+    Converts a stream of two or four level symbols to bytes (hard decision, most significant bit first).
+
+    The two level symbols are decided by the sign, and the four level symbols by the nearest level (-3, -1, +1 or
+    +3). The number of symbols must be a multiple of 8 (two level) or 4 (four level).
+
+    :param symbols: Symbols to convert (integers or soft values). A 2-D array is converted row by row.
+    :type symbols: list or numpy.ndarray
+
+    :param mod: Modulation type (two=0 or four level=1, default 0).
+    :type mod: int, optional
+
+    :return: The bytes of the symbols.
+    :rtype: numpy.ndarray (uint8)
+    """
+    _require_numpy()
+
+    symbols = np.asarray(symbols)
+
+    if mod == 0:
+        return np.packbits(symbols > 0, axis=-1)
+    else:
+        levels = np.digitize(symbols, _PYNGHAM_THRESHOLDS_FOUR_LEVEL, right=True)
+        dibits = np.array(_PYNGHAM_DIBITS_FOUR_LEVEL, dtype=np.uint8)[levels]
+        dibits = dibits.reshape(dibits.shape[:-1] + (-1, 4))
+
+        return (dibits[..., 0] << 6) | (dibits[..., 1] << 4) | (dibits[..., 2] << 2) | dibits[..., 3]
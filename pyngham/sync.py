@@ -0,0 +1,320 @@
+#
+# sync.py
+#
+# Copyright (C) 2023, Gabriel Mariano Marcelino - PU5GMA <gabriel.mm8@gmail.com>
+#
+# This file is part of PyNGHam library.
+#
+# PyNGHam library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# PyNGHam library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with PyNGHam library. If not, see <http://www.gnu.org/licenses/>.
+#
+#
+
+
+try:
+    import numpy as np
+except ImportError:     # NumPy is required by the bit stream synchronizer
+    np = None
+
+from pyngham.pyngham import PyNGHam, _PYNGHAM_SYNC_WORD, _PYNGHAM_SYNC_WORD_FOUR_LEVEL, _PYNGHAM_PL_PAR_SIZES
+from pyngham.pyngham import _buffer_bytes, _scramble, _popcount
+
+_PYNGHAM_SYNC_WORD_INT              = int.from_bytes(bytes(_PYNGHAM_SYNC_WORD), 'big')
+_PYNGHAM_SYNC_WORD_FOUR_LEVEL_INT   = int.from_bytes(bytes(_PYNGHAM_SYNC_WORD_FOUR_LEVEL), 'big')
+_PYNGHAM_SYNC_MASK                  = (1 << (8 * len(_PYNGHAM_SYNC_WORD))) - 1
+_PYNGHAM_SYNC_MASK_FOUR_LEVEL       = (1 << (8 * len(_PYNGHAM_SYNC_WORD_FOUR_LEVEL))) - 1
+_PYNGHAM_SYNC_MAX_ERRORS            = 3
+
+def _require_numpy():
+    """
+    Checks if NumPy is available.
+
+    :return: None.
+    :rtype: None
+    """
+    if np is None:
+        raise ImportError('NumPy is required to synchronize bit streams')
+
+class PyNGHamSync:
+    """
+    Streaming frame synchronizer.
+
+    The received bytes are shifted into rolling registers, which are compared with the sync words of the two and four
+    level modulations (up to a maximum number of bit errors). When a sync word is found, the size tag and the whole
+    codeword are taken from the stream and decoded.
+    """
+
+    def __init__(self, ngham=None, mod=None, max_errors=_PYNGHAM_SYNC_MAX_ERRORS):
+        """
+        Constructor.
+
+        :param ngham: NGHam decoder. If None, a new one is created with the default parameters.
+        :type ngham: PyNGHam, optional
+
+        :param mod: Modulation to search (0 = two level, 1 = four level). If None, both sync words are searched (the modulation is detected automatically).
+        :type mod: int, optional
+
+        :param max_errors: Maximum number of bit errors in the sync word, default 3.
+        :type max_errors: int, optional
+
+        :return: None.
+        :rtype: None
+        """
+        if ngham is None:
+            ngham = PyNGHam()
+
+        self._ngham = ngham
+        self._mod = mod
+        self._max_errors = max_errors
+
+        self.reset()
+
+    def reset(self):
+        """
+        Resets the synchronizer (searching for a sync word again).
+
+        :return: None.
+        :rtype: None
+        """
+        self._reg = 0
+        self._reg_len = 0
+        self._sync_mod = -1         # Modulation of the last sync word found (-1 = searching)
+        self._size_nr = -1          # Size number of the frame (-1 = size tag not received)
+        self._buf = bytearray()
+
+    def feed(self, data):
+        """
+        Processes a chunk of the received stream.
+
+        :param data: Received bytes.
+        :type data: list[int], bytes, bytearray, memoryview or numpy.ndarray
+
+        :return: The decoded frames, each one as the decoded data, the number of corrected errors, a list with the bit position of the errors and the detected modulation (0 = two level, 1 = four level).
+        :rtype: list[tuple[list[int], int, list[int], int]]
+        """
+        data = _buffer_bytes(data)
+
+        res = list()
+
+        pos = 0
+        n = len(data)
+        while pos < n:
+            if self._sync_mod < 0:
+                pos = self._search(data, pos)
+            elif self._size_nr < 0:
+                # Size tag
+                need = 3 - len(self._buf)
+                self._buf += data[pos:pos + need]
+                pos = pos + min(need, n - pos)
+
+                if len(self._buf) == 3:
+                    self._size_nr = self._ngham._find_size((self._buf[0] << 16) | (self._buf[1] << 8) | self._buf[2])
+                    self._buf = bytearray()
+                    if self._size_nr < 0:
+                        self._sync_mod = -1     # Invalid size tag: false sync detection
+            else:
+                # Codeword
+                need = _PYNGHAM_PL_PAR_SIZES[self._size_nr] - len(self._buf)
+                self._buf += data[pos:pos + need]
+                pos = pos + min(need, n - pos)
+
+                if len(self._buf) == _PYNGHAM_PL_PAR_SIZES[self._size_nr]:
+                    pl, errors, err_pos = self._ngham._decode_codeword(self._size_nr, _scramble(self._buf))
+                    if len(pl) > 0:
+                        res.append((pl, errors, err_pos, self._sync_mod))
+
+                    self.reset()
+
+        return res
+
+    def _search(self, data, pos):
+        """
+        Searches a sync word in the stream.
+
+        :param data: Received bytes.
+        :type data: bytes, bytearray or memoryview
+
+        :param pos: Position of the first byte to search.
+        :type pos: int
+
+        :return: The position after the sync word (or the end of the data, if no sync word was found).
+        :rtype: int
+        """
+        reg = self._reg
+        reg_len = self._reg_len
+        max_errors = self._max_errors
+        two_level = self._mod != 1
+        four_level = self._mod != 0
+
+        for i in range(pos, len(data)):
+            reg = ((reg << 8) | data[i]) & _PYNGHAM_SYNC_MASK_FOUR_LEVEL
+            reg_len = reg_len + 1
+
+            if four_level and (reg_len >= len(_PYNGHAM_SYNC_WORD_FOUR_LEVEL)) and (_popcount(reg ^ _PYNGHAM_SYNC_WORD_FOUR_LEVEL_INT) <= max_errors):
+                self._sync_mod = 1
+            elif two_level and (reg_len >= len(_PYNGHAM_SYNC_WORD)) and (_popcount((reg & _PYNGHAM_SYNC_MASK) ^ _PYNGHAM_SYNC_WORD_INT) <= max_errors):
+                self._sync_mod = 0
+            else:
+                continue
+
+            self._reg = 0
+            self._reg_len = 0
+
+            return i + 1
+
+        self._reg = reg
+        self._reg_len = reg_len
+
+        return len(data)
+
+class PyNGHamBitSync:
+    """
+    Bit stream frame synchronizer (requires NumPy).
+
+    The sync words are searched at any bit offset, by correlating the received bits (as +1/-1) with the bits of the
+    sync words of the two and four level modulations. When a sync word is found (up to a maximum number of bit
+    errors), the following bits are packed into bytes at once and decoded.
+    """
+
+    def __init__(self, ngham=None, mod=None, max_errors=_PYNGHAM_SYNC_MAX_ERRORS):
+        """
+        Constructor.
+
+        :param ngham: NGHam decoder. If None, a new one is created with the default parameters.
+        :type ngham: PyNGHam, optional
+
+        :param mod: Modulation to search (0 = two level, 1 = four level). If None, both sync words are searched (the modulation is detected automatically).
+        :type mod: int, optional
+
+        :param max_errors: Maximum number of bit errors in the sync word, default 3.
+        :type max_errors: int, optional
+
+        :return: None.
+        :rtype: None
+        """
+        _require_numpy()
+
+        if ngham is None:
+            ngham = PyNGHam()
+
+        self._ngham = ngham
+        self._max_errors = max_errors
+
+        # Sync words of each modulation as +1/-1 (bits 1 and 0)
+        self._patterns = list()
+        if mod != 1:
+            self._patterns.append((0, 2 * np.unpackbits(np.array(_PYNGHAM_SYNC_WORD, dtype=np.uint8)).astype(np.int16) - 1))
+        if mod != 0:
+            self._patterns.append((1, 2 * np.unpackbits(np.array(_PYNGHAM_SYNC_WORD_FOUR_LEVEL, dtype=np.uint8)).astype(np.int16) - 1))
+
+        self._max_pattern_len = max([len(p) for m, p in self._patterns])
+
+        self.reset()
+
+    def reset(self):
+        """
+        Resets the synchronizer (discarding the buffered bits and searching for a sync word again).
+
+        :return: None.
+        :rtype: None
+        """
+        self._bits = np.zeros(0, dtype=np.uint8)
+        self._sync_mod = -1         # Modulation of the last sync word found (-1 = searching)
+
+    def feed(self, bits, packed=False):
+        """
+        Processes a chunk of the received bit stream.
+
+        :param bits: Received bits, one per element (0 or 1), or packed in bytes (most significant bit first).
+        :type bits: list[int], bytes, bytearray, memoryview or numpy.ndarray
+
+        :param packed: If True, the bits are packed in bytes, default False.
+        :type packed: bool, optional
+
+        :return: The decoded frames, each one as the decoded data, the number of corrected errors, a list with the bit position of the errors and the detected modulation (0 = two level, 1 = four level).
+        :rtype: list[tuple[list[int], int, list[int], int]]
+        """
+        if packed:
+            bits = np.unpackbits(np.frombuffer(_buffer_bytes(bits), dtype=np.uint8))
+        elif isinstance(bits, (bytes, bytearray, memoryview)):
+            bits = np.frombuffer(_buffer_bytes(bits), dtype=np.uint8)
+        else:
+            bits = np.asarray(bits, dtype=np.uint8)
+
+        self._bits = np.concatenate((self._bits, bits))
+
+        res = list()
+
+        while True:
+            if self._sync_mod < 0:
+                if not self._search():
+                    break
+            else:
+                if len(self._bits) < 24:
+                    break
+
+                size_nr = self._ngham._find_size(int.from_bytes(np.packbits(self._bits[:24]).tobytes(), 'big'))
+                if size_nr < 0:
+                    self._sync_mod = -1     # Invalid size tag: false sync detection (searching again from here)
+                    continue
+
+                length = 24 + 8 * _PYNGHAM_PL_PAR_SIZES[size_nr]
+                if len(self._bits) < length:
+                    break
+
+                codeword = _scramble(np.packbits(self._bits[24:length]).tobytes())
+
+                pl, errors, err_pos = self._ngham._decode_codeword(size_nr, codeword)
+                if len(pl) > 0:
+                    res.append((pl, errors, err_pos, self._sync_mod))
+
+                self._bits = self._bits[length:]
+                self._sync_mod = -1
+
+        return res
+
+    def _search(self):
+        """
+        Searches a sync word in the buffered bits.
+
+        If a sync word is found, the bits up to its end are discarded. Otherwise, only the last bits (that can be the
+        beginning of a sync word) are kept.
+
+        :return: True if a sync word was found, False otherwise.
+        :rtype: bool
+        """
+        x = 2 * self._bits.astype(np.int16) - 1
+
+        best_end = -1
+        for mod, pattern in self._patterns:
+            if len(x) < len(pattern):
+                continue
+
+            # Number of different bits of each window = (length - correlation)/2
+            errors = (len(pattern) - np.correlate(x, pattern, 'valid')) // 2
+
+            found = np.flatnonzero(errors <= self._max_errors)
+            if len(found) > 0:
+                end = int(found[0]) + len(pattern)
+                if (best_end < 0) or (end < best_end):
+                    best_end = end
+                    self._sync_mod = mod
+
+        if best_end < 0:
+            self._bits = self._bits[max(0, len(self._bits) - self._max_pattern_len + 1):]
+
+            return False
+
+        self._bits = self._bits[best_end:]
+
+        return True
@@ -0,0 +1,244 @@
+#
+# txqueue.py
+#
+# Copyright (C) 2023, Gabriel Mariano Marcelino - PU5GMA <gabriel.mm8@gmail.com>
+#
+# This file is part of PyNGHam library.
+#
+# PyNGHam library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# PyNGHam library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with PyNGHam library. If not, see <http://www.gnu.org/licenses/>.
+#
+#
+
+
+import asyncio
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+
+from pyngham.pyngham import PyNGHam, _PYNGHAM_PL_SIZES, _payload_bytes
+from pyngham.spp import PyNGHamSPP
+
+class TXPriority(Enum):
+    """
+    Transmission priorities.
+
+    * **HIGH**: Time-critical frames (command replies, for example)
+    * **NORMAL**: Regular frames (beacons, for example)
+    * **LOW**: Bulk data frames (fragments of files, for example)
+    """
+    HIGH        = 0     # Time-critical frames
+    NORMAL      = 1     # Regular frames
+    LOW         = 2     # Bulk data frames
+
+class PyNGHamTXQueue:
+    """
+    Asyncio priority transmit queue.
+
+    The frames are encoded ahead of time by a worker, one at a time, and are encoded and taken from the queue by
+    priority (and in order of arrival for frames with the same priority): a new high priority frame is encoded right
+    after the frame being encoded, before the lower priority frames queued earlier. When the queue is full, new frames
+    wait for free space (backpressure).
+    """
+
+    def __init__(self, ngham=None, spp=None, maxsize=16, executor=None):
+        """
+        Constructor.
+
+        :param ngham: NGHam encoder used to generate the RF frames. If None, a new one is created with the default parameters.
+        :type ngham: PyNGHam, optional
+
+        :param spp: SPP encoder used to generate the SPP TX frames. If None, a new one is created.
+        :type spp: PyNGHamSPP, optional
+
+        :param maxsize: Maximum number of queued frames (0 for an unbounded queue), default 16.
+        :type maxsize: int, optional
+
+        :param executor: Executor used to encode the frames (one frame at a time). If None, a pool with a single worker thread is created.
+        :type executor: concurrent.futures.Executor, optional
+
+        :return: None.
+        :rtype: None
+        """
+        if ngham is None:
+            ngham = PyNGHam()
+
+        if spp is None:
+            spp = PyNGHamSPP()
+
+        self._ngham = ngham
+        self._spp = spp
+        self._maxsize = maxsize
+        self._own_executor = executor is None
+        self._executor = ThreadPoolExecutor(max_workers=1) if executor is None else executor
+
+        self._heap = list()     # Frames as (priority, sequence, future)
+        self._pending = list()  # Frames not encoded yet as (priority, sequence, future, payload, flags, spp)
+        self._encoding = False
+        self._seq = 0
+        self._cond = asyncio.Condition()
+
+    def qsize(self):
+        """
+        Gets the number of queued frames.
+
+        :return: The number of frames in the queue (encoded or not).
+        :rtype: int
+        """
+        return len(self._heap)
+
+    def full(self):
+        """
+        Checks if the queue is full.
+
+        :return: True if the queue is full, False otherwise.
+        :rtype: bool
+        """
+        return (self._maxsize > 0) and (len(self._heap) >= self._maxsize)
+
+    async def put(self, pl, priority=TXPriority.NORMAL, flags=0, spp=False):
+        """
+        Queues a payload to transmit, scheduling its encoding by priority.
+
+        If the queue is full, waits until there is free space.
+
+        :param pl: Payload of the frame (1 to 220 bytes).
+        :type pl: list[int], bytes, bytearray or str
+
+        :param priority: Priority of the frame (a TXPriority or an integer, lower values first), default TXPriority.NORMAL.
+        :type priority: TXPriority or int, optional
+
+        :param flags: NGHam packet flags (or SPP TX packet flags), default 0.
+        :type flags: int, optional
+
+        :param spp: If True, the frame is encoded as a SPP TX packet, otherwise as a NGHam packet, default False.
+        :type spp: bool, optional
+
+        :return: None.
+        :rtype: None
+        """
+        pl = bytes(_payload_bytes(pl))
+
+        if (len(pl) == 0) or (len(pl) > _PYNGHAM_PL_SIZES[-1]):
+            raise ValueError('Payloads must have between 1 and ' + str(_PYNGHAM_PL_SIZES[-1]) + ' bytes (got ' + str(len(pl)) + ')')
+
+        if isinstance(priority, TXPriority):
+            priority = priority.value
+
+        loop = asyncio.get_running_loop()
+
+        async with self._cond:
+            await self._cond.wait_for(lambda: not self.full())
+
+            fut = loop.create_future()
+
+            heapq.heappush(self._heap, (priority, self._seq, fut))
+            heapq.heappush(self._pending, (priority, self._seq, fut, pl, flags, spp))
+            self._seq = self._seq + 1
+
+            self._encode_next(loop)
+
+            self._cond.notify_all()
+
+    async def get(self):
+        """
+        Takes the next frame to transmit, waiting for a frame (and its encoding) if needed.
+
+        :return: The encoded frame with the highest priority.
+        :rtype: bytes
+        """
+        async with self._cond:
+            await self._cond.wait_for(lambda: len(self._heap) > 0)
+
+            priority, seq, fut = heapq.heappop(self._heap)
+
+            self._cond.notify_all()
+
+        return await fut
+
+    def close(self):
+        """
+        Stops the worker pool (if created by the queue).
+
+        :return: None.
+        :rtype: None
+        """
+        if self._own_executor:
+            self._executor.shutdown(wait=False)
+
+    def _encode_next(self, loop):
+        """
+        Starts the encoding of the frame with the highest priority not encoded yet (if no frame is being encoded).
+
+        :param loop: Event loop of the queue.
+        :type loop: asyncio.AbstractEventLoop
+
+        :return: None.
+        :rtype: None
+        """
+        while (not self._encoding) and (len(self._pending) > 0):
+            priority, seq, fut, pl, flags, spp = heapq.heappop(self._pending)
+            if fut.done():
+                continue    # Cancelled
+
+            if spp:
+                enc_fut = loop.run_in_executor(self._executor, self._encode_spp, pl, flags)
+            else:
+                enc_fut = loop.run_in_executor(self._executor, self._ngham.encode_bytes, pl, flags)
+
+            self._encoding = True
+
+            enc_fut.add_done_callback(lambda f, fut=fut: self._encoded(loop, fut, f))
+
+    def _encoded(self, loop, fut, enc_fut):
+        """
+        Delivers an encoded frame and starts the encoding of the next one.
+
+        :param loop: Event loop of the queue.
+        :type loop: asyncio.AbstractEventLoop
+
+        :param fut: Future of the frame in the queue.
+        :type fut: asyncio.Future
+
+        :param enc_fut: Future of the encoding.
+        :type enc_fut: asyncio.Future
+
+        :return: None.
+        :rtype: None
+        """
+        self._encoding = False
+
+        if not fut.done():
+            if enc_fut.cancelled():
+                fut.cancel()
+            elif enc_fut.exception() is not None:
+                fut.set_exception(enc_fut.exception())
+            else:
+                fut.set_result(enc_fut.result())
+
+        self._encode_next(loop)
+
+    def _encode_spp(self, pl, flags):
+        """
+        Encodes a payload as a SPP TX packet.
+
+        :param pl: Payload of the frame.
+        :type pl: bytes
+
+        :param flags: SPP TX packet flags.
+        :type flags: int
+
+        :return: The encoded SPP TX packet.
+        :rtype: bytes
+        """
+        return bytes(self._spp.encode_tx_pkt(flags, list(pl)))
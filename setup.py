@@ -63,5 +63,6 @@ setuptools.setup(
         ],
     download_url                    = "https://github.com/mgm8/pyngham/releases",
     packages                        = setuptools.find_packages(),
-    install_requires                = ['crc==3.0.0'],
+    install_requires                = [],
+    extras_require                  = {'numpy': ['numpy']},
 )
@@ -0,0 +1,41 @@
+#
+# test_crc16.py
+# 
+# Copyright (C) 2023, Gabriel Mariano Marcelino - PU5GMA <gabriel.mm8@gmail.com>
+# 
+# This file is part of PyNGHam library.
+# 
+# PyNGHam library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# 
+# PyNGHam library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+# 
+# You should have received a copy of the GNU Lesser General Public License
+# along with PyNGHam library. If not, see <http://www.gnu.org/licenses/>.
+# 
+#
+
+
+from pyngham.crc16 import crc16, crc16_update, CRC16_INIT, CRC16_XOROUT
+from random import randrange
+
+def test_crc16():
+    # Check value of the CRC-16/X.25
+    assert crc16(b"123456789") == 0x906E
+    assert crc16([ord(x) for x in "123456789"]) == 0x906E
+    assert crc16(memoryview(b"123456789")) == 0x906E
+
+def test_crc16_update():
+    data = bytes([randrange(256) for i in range(randrange(1, 256))])
+
+    split = randrange(len(data))
+
+    crc = crc16_update(CRC16_INIT, data[:split])
+    crc = crc16_update(crc, memoryview(data)[split:])
+
+    assert crc ^ CRC16_XOROUT == crc16(data)
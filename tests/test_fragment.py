@@ -0,0 +1,86 @@
+#
+# test_fragment.py
+# 
+# Copyright (C) 2023, Gabriel Mariano Marcelino - PU5GMA <gabriel.mm8@gmail.com>
+# 
+# This file is part of PyNGHam library.
+# 
+# PyNGHam library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# 
+# PyNGHam library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+# 
+# You should have received a copy of the GNU Lesser General Public License
+# along with PyNGHam library. If not, see <http://www.gnu.org/licenses/>.
+# 
+#
+
+
+
+import pytest
+import pyngham
+from random import randrange, shuffle
+
+def test_fragment_reassembly():
+    pngh = pyngham.PyNGHam()
+    frag = pyngham.PyNGHamFragmenter(pngh)
+    reas = pyngham.PyNGHamReassembler()
+
+    for n in [0, 1, 212, 213, 1000, 5000]:
+        obj = bytes([randrange(256) for i in range(n)])
+        obj_id = randrange(2**16)
+
+        buf, offsets = frag.encode(obj, obj_id)
+
+        pkts = [buf[offsets[i]:offsets[i + 1]] for i in range(len(offsets) - 1)]
+        assert len(pkts) == max(1, -(-n // 212))
+
+        # Out of order reception
+        shuffle(pkts)
+
+        res = list()
+        for pkt in pkts:
+            assert res == []
+            res = reas.add(pngh.decode(pkt)[0])
+
+        assert res == [(obj_id, obj)]
+        assert reas.pending() == []
+
+def test_fragment_missing():
+    frag = pyngham.PyNGHamFragmenter(chunk_size=10)
+    reas = pyngham.PyNGHamReassembler(max_objects=2)
+
+    obj = bytes([randrange(256) for i in range(95)])
+    pls = frag.fragment(obj, 7)
+
+    assert len(pls) == 10
+
+    for i in [0, 2, 3, 5, 6, 7, 9]:
+        assert reas.add(pls[i]) == []
+
+    # Duplicated fragment
+    assert reas.add(pls[9]) == []
+
+    assert reas.pending() == [7]
+    assert reas.missing(7) == [1, 4, 8]
+
+    # Bounded number of objects: the oldest object is discarded
+    reas.add(frag.fragment(obj, 8)[0])
+    reas.add(frag.fragment(obj, 9)[0])
+
+    assert reas.pending() == [8, 9]
+    assert reas.missing(7) == []
+
+def test_fragment_invalid_id():
+    frag = pyngham.PyNGHamFragmenter()
+
+    assert len(frag.fragment(b'abc', 0xFFFF)) == 1
+
+    for obj_id in [-1, 0x10000]:
+        with pytest.raises(ValueError):
+            frag.fragment(b'abc', obj_id)
@@ -21,8 +21,10 @@
 #
 
 
+import pytest
+
 from pyngham import PyNGHam
-from random import randrange
+from random import randrange, sample
 
 def test_rf_pkt():
     pngh = PyNGHam()
@@ -56,3 +58,281 @@ def test_rf_pkt():
         assert pl == dec_pl
         assert errors > 0
         assert len(err_loc) > 0
+
+def test_rf_pkt_erasures():
+    pngh = PyNGHam()
+
+    for i in [10, 50, 100, 200]:
+        pl = [randrange(256) for j in range(i)]
+
+        pkt = pngh.encode(pl)
+
+        # Twice the number of errors that can be corrected without erasures
+        if (i < (159 + 8 + 3)):
+            num_err = 16
+        else:
+            num_err = 32
+
+        reliability = [1.0] * len(pkt)
+        for err_byte in sample(range(8 + 3, 8 + 3 + i), num_err if num_err < i else i):
+            pkt[err_byte] = pkt[err_byte] ^ randrange(1, 256)
+            reliability[err_byte] = 0.1
+
+        assert pngh.decode(pkt, reliability)[0] == pl
+
+def test_rf_pkt_update():
+    for mod in [0, 1]:
+        pngh = PyNGHam(mod)
+
+        for i in [1, 28, 29, 100, 220]:
+            pl = [randrange(256) for j in range(i)]
+
+            pkt = pngh.encode(pl, 2)
+
+            offsets = sample(range(i), min(i, 3))
+            for j in offsets:
+                pl[j] = randrange(256)
+
+            assert pngh.encode_update(pkt, pl, offsets) == pngh.encode(pl, 2)
+
+            # Offsets out of the payload
+            assert pngh.encode_update(pkt, pl, [i]) == []
+
+    # Different payload length in the same size class
+    pngh = PyNGHam()
+
+    pkt = pngh.encode([randrange(256) for j in range(20)])
+
+    assert pngh.encode_update(pkt, [randrange(256) for j in range(22)], [0]) == []
+
+def test_rf_pkt_encode_into():
+    pngh = PyNGHam()
+
+    buf = bytearray(1000)
+    offset = 0
+    pkts = list()
+    for i in [1, 28, 100, 220]:
+        pl = bytes([randrange(256) for j in range(i)])
+
+        n = pngh.encode_into(buf, offset, pl, 1)
+
+        assert bytes(buf[offset:offset + n]) == pngh.encode_bytes(pl, 1)
+        assert list(buf[offset:offset + n]) == pngh.encode(list(pl), 1)
+
+        pkts.append((offset, n, pl))
+        offset = offset + n
+
+    # Previous packets are not changed
+    for offset, n, pl in pkts:
+        assert pngh.decode(memoryview(buf)[offset:offset + n])[0] == list(pl)
+
+    assert pngh.encode_into(buf, 0, bytes(221)) == 0
+
+def test_rf_pkt_encode_many():
+    for mod in [0, 1]:
+        pngh = PyNGHam(mod)
+
+        pls = [[randrange(256) for j in range(randrange(1, 220 + 1))] for i in range(50)]
+        pls.append(list())
+
+        buf, offsets = pngh.encode_many(pls, 3)
+
+        assert len(offsets) == len(pls) + 1
+        assert offsets[-1] == len(buf)
+
+        for i in range(len(pls)):
+            assert list(buf[offsets[i]:offsets[i + 1]]) == pngh.encode(pls[i], 3)
+
+def test_rf_pkt_encode_cache():
+    pngh = PyNGHam()
+    pngh_cache = PyNGHam(cache_size=4)
+
+    pls = [bytes([randrange(256) for j in range(randrange(1, 220 + 1))]) for i in range(6)]
+
+    for pl in pls[:4]:
+        assert pngh_cache.encode_bytes(pl) == pngh.encode_bytes(pl)
+
+    # Hits with the same payload in other formats
+    assert pngh_cache.encode(list(pls[0])) == pngh.encode(pls[0])
+    assert pngh_cache.encode_bytes(bytearray(pls[1])) == pngh.encode_bytes(pls[1])
+
+    # Different flags are different packets
+    assert pngh_cache.encode_bytes(pls[2], 1) == pngh.encode_bytes(pls[2], 1)
+
+    assert pngh_cache.cache_info() == {"hits": 2, "misses": 5, "size": 4, "max_size": 4}
+
+    # The least recently used packets (pls[3] and pls[0]) are discarded
+    for pl in pls[4:]:
+        assert pngh_cache.encode_bytes(pl) == pngh.encode_bytes(pl)
+
+    buf = bytearray(300)
+    n = pngh_cache.encode_into(buf, 10, pls[1])
+    assert bytes(buf[10:10 + n]) == pngh.encode_bytes(pls[1])
+
+    assert pngh_cache.encode_bytes(pls[3]) == pngh.encode_bytes(pls[3])
+
+    assert pngh_cache.cache_info() == {"hits": 3, "misses": 8, "size": 4, "max_size": 4}
+
+    pngh_cache.cache_clear()
+
+    assert pngh_cache.cache_info() == {"hits": 0, "misses": 0, "size": 0, "max_size": 4}
+
+def test_rf_pkt_decode_buffer():
+    pngh = PyNGHam()
+
+    for i in [1, 28, 100, 220]:
+        pl = [randrange(256) for j in range(i)]
+
+        pkt = pngh.encode_bytes(pl)
+
+        assert pngh.decode(pkt)[0] == pl
+        assert pngh.decode(bytearray(pkt))[0] == pl
+        assert pngh.decode(memoryview(pkt))[0] == pl
+
+        # Without preamble and sync word, after some noise
+        assert pngh.decode(bytes([0x00, 0xFF, 0x00]) + pkt[8:])[0] == pl
+
+    np = pytest.importorskip("numpy")
+
+    for i in [1, 28, 100, 220]:
+        pl = [randrange(256) for j in range(i)]
+
+        pkt = pngh.encode_bytes(pl)
+
+        assert pngh.decode(np.frombuffer(pkt, dtype=np.uint8))[0] == pl
+        assert pngh.decode(np.array(list(pkt)))[0] == pl
+
+def test_rf_pkt_size_tag():
+    pngh = PyNGHam()
+    pngh_all = PyNGHam(try_all_sizes=True)
+
+    for i in [1, 28, 29, 100, 200, 220]:
+        pl = [randrange(256) for j in range(i)]
+
+        pkt = bytearray(pngh.encode_bytes(pl))
+
+        # Size tag with up to 6 wrong bits
+        for j in sample(range(24), 6):
+            pkt[8 + j // 8] ^= 1 << (j % 8)
+
+        assert pngh.decode(pkt)[0] == pl
+
+        # Damaged size tag (more than 6 wrong bits from any size tag)
+        while pngh._find_size((pkt[8] << 16) | (pkt[9] << 8) | pkt[10]) >= 0:
+            pkt[8:11] = bytes([randrange(256) for j in range(3)])
+
+        assert pngh_all.decode(pkt)[0] == pl
+
+        # Split in two chunks
+        res = pngh_all.decode_bytes(pkt[8:100]) + pngh_all.decode_bytes(pkt[100:])
+        assert [r[0] for r in res] == [pl]
+
+        # Byte by byte
+        for byte in pkt[8:]:
+            res = pngh_all.decode_byte(byte)
+            if len(res[0]) > 0:
+                break
+
+        assert res[0] == pl
+
+def test_rf_pkt_size_tag_stream():
+    pngh = PyNGHam()
+
+    # Packets with damaged size tags, mixed with noise
+    stream = bytearray()
+    for i in range(10):
+        pkt = bytearray(pngh.encode_bytes([randrange(256) for j in range(randrange(1, 220 + 1))])[8:])
+        if randrange(2):
+            while pngh._find_size((pkt[0] << 16) | (pkt[1] << 8) | pkt[2]) >= 0:
+                pkt[0:3] = bytes([randrange(256) for j in range(3)])
+
+        stream += pkt + bytes([randrange(256) for j in range(randrange(0, 300))])
+
+    res = PyNGHam(try_all_sizes=True).decode_bytes(stream)
+
+    # Byte by byte
+    pngh_all = PyNGHam(try_all_sizes=True)
+    res_bytes = list()
+    for byte in stream:
+        r = pngh_all.decode_byte(byte)
+        if len(r[0]) > 0:
+            res_bytes.append(r)
+
+    assert res_bytes == res
+
+    # Chunks of random size (the result does not depend on how the stream is split)
+    pngh_all = PyNGHam(try_all_sizes=True)
+    res_chunks = list()
+    pos = 0
+    while pos < len(stream):
+        n = randrange(1, 600)
+        res_chunks = res_chunks + pngh_all.decode_bytes(stream[pos:pos + n])
+        pos = pos + n
+
+    assert res_chunks == res
+
+def test_rf_pkt_decode_bytes():
+    pngh = PyNGHam()
+
+    stream = bytearray()
+    pls = list()
+    for i in range(20):
+        pl = [randrange(256) for j in range(randrange(1, 220 + 1))]
+
+        # Size tag and codeword (without preamble and sync word)
+        stream += pngh.encode_bytes(pl)[8:]
+        pls.append(pl)
+
+    # Stream received in chunks of random size (the packets are split between chunks)
+    res = list()
+    pos = 0
+    while pos < len(stream):
+        n = randrange(1, 300)
+        res = res + pngh.decode_bytes(stream[pos:pos + n])
+        pos = pos + n
+
+    assert [r[0] for r in res] == pls
+    assert [r[1] for r in res] == [0] * len(pls)
+
+    # Mixed with decode_byte
+    pkt = pngh.encode_bytes(pls[0])[8:]
+
+    assert pngh.decode_bytes(pkt[:10]) == []
+    for byte in pkt[10:20]:
+        assert pngh.decode_byte(byte) == ((), 0, ())
+    assert pngh.decode_bytes(pkt[20:]) == [(pls[0], 0, [])]
+
+def test_rf_pkt_decode_error():
+    pngh = PyNGHam()
+
+    pkt = bytearray(pngh.encode_bytes([randrange(256) for j in range(100)]))
+
+    # More damaged bytes than the Reed-Solomon code can correct
+    for j in range(8 + 3, len(pkt), 4):
+        pkt[j] ^= 0xFF
+
+    assert pngh.decode(pkt) == ((), -1, ())
+
+    for byte in pkt[8:]:
+        res = pngh.decode_byte(byte)
+
+    assert res == ((), -1, ())
+
+def test_rf_pkt_decode_byte_buffer():
+    pngh = PyNGHam()
+
+    buf = pngh._decoder_buf
+
+    for i in [1, 28, 100, 220, 50]:
+        pl = [randrange(256) for j in range(i)]
+
+        reliability = [randrange(1, 100) / 100 for j in range(255 + 3)]
+
+        for byte, rel in zip(pngh.encode_bytes(pl)[8:], reliability):
+            res = pngh.decode_byte(byte, rel)
+
+        assert res == (pl, 0, [])
+
+    # The same preallocated buffer is used by all packets
+    assert pngh._decoder_buf is buf
+    assert len(buf) == 255
@@ -0,0 +1,146 @@
+#
+# test_rs.py
+# 
+# Copyright (C) 2023, Gabriel Mariano Marcelino - PU5GMA <gabriel.mm8@gmail.com>
+# 
+# This file is part of PyNGHam library.
+# 
+# PyNGHam library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# 
+# PyNGHam library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+# 
+# You should have received a copy of the GNU Lesser General Public License
+# along with PyNGHam library. If not, see <http://www.gnu.org/licenses/>.
+# 
+#
+
+
+import pytest
+
+from pyngham import RS
+from pyngham.rs import get_backend, check_backend
+from random import randrange, sample
+
+def test_rs_encode():
+    for nroots, pad in [(16, 208), (16, 144), (32, 96), (32, 0)]:
+        rs = RS(8, 0x187, 112, 11, nroots, pad)
+
+        data = [randrange(256) for i in range(255 - nroots - pad)]
+
+        parity = rs.encode(data)
+
+        assert len(parity) == nroots
+
+        # A valid codeword has no errors
+        cw, errors, err_pos = rs.decode(data + parity, [0], 0)
+
+        assert cw == data + parity
+        assert errors == 0
+
+        # The encoding is linear: parity(a ^ b) = parity(a) ^ parity(b)
+        other = [randrange(256) for i in range(len(data))]
+
+        assert rs.encode([a ^ b for a, b in zip(data, other)]) == [a ^ b for a, b in zip(parity, rs.encode(other))]
+
+def test_rs_decode():
+    for nroots, pad in [(16, 208), (16, 144), (32, 96), (32, 0)]:
+        rs = RS(8, 0x187, 112, 11, nroots, pad)
+
+        data = [randrange(256) for i in range(255 - nroots - pad)]
+        cw = data + rs.encode(data)
+
+        rx = list(cw)
+        for pos in sample(range(len(rx)), nroots // 2):
+            rx[pos] = rx[pos] ^ randrange(1, 256)
+
+        dec, errors, err_pos = rs.decode(list(rx), [0], 0)
+
+        assert dec == cw
+        assert errors == nroots // 2
+        assert len(err_pos) == nroots // 2
+
+        # The search restricted to the shortened block gives the same result
+        assert rs.decode(list(rx), [0], 0, True) == (dec, errors, err_pos)
+
+def test_rs_shared_tables():
+    rs1 = RS(8, 0x187, 112, 11, 16, 208)
+    rs2 = RS(8, 0x187, 112, 11, 16, 144)
+    rs3 = RS(8, 0x187, 112, 11, 32, 96)
+
+    # Same code, different padding
+    assert rs1._code is rs2._code
+
+    # Same field, different generator polynomial
+    assert rs1._code is not rs3._code
+    assert rs1._code.gf is rs3._code.gf
+
+def test_rs_decode_batch():
+    np = pytest.importorskip("numpy")
+
+    rs = RS(8, 0x187, 112, 11, 32, 96)
+
+    rows = list()
+    for i in range(20):
+        data = [randrange(256) for j in range(255 - 32 - 96)]
+        rows.append(data + rs.encode(data))
+
+    rx = np.array(rows, dtype=np.uint8)
+    for i in range(0, 20, 2):
+        for pos in sample(range(rx.shape[1]), randrange(1, 16 + 1)):
+            rx[i, pos] = rx[i, pos] ^ randrange(1, 256)
+
+    s, clean = rs.syndromes_batch(rx)
+
+    for i in range(20):
+        assert s[i].tolist() == rs.syndromes(rx[i].tolist())
+        assert clean[i] == (i % 2 == 1)
+
+    dec, counts, err_pos = rs.decode_batch(rx)
+
+    for i in range(20):
+        assert dec[i].tolist() == rows[i]
+        assert counts[i] == rs.decode(rx[i].tolist(), [0], 0)[1]
+
+def test_rs_decode_vectorized():
+    pytest.importorskip("numpy")
+
+    for nroots, pad in [(16, 208), (32, 0)]:
+        rs = RS(8, 0x187, 112, 11, nroots, pad)
+
+        for n in range(nroots):
+            data = [randrange(256) for i in range(255 - nroots - pad)]
+            rx = data + rs.encode(data)
+            for pos in sample(range(len(rx)), n):
+                rx[pos] = rx[pos] ^ randrange(1, 256)
+
+            for shortened in [False, True]:
+                assert rs.decode(list(rx), [0], 0, shortened, True) == rs.decode(list(rx), [0], 0, shortened)
+
+def test_rs_encode_batch():
+    np = pytest.importorskip("numpy")
+
+    for nroots, pad in [(16, 208), (32, 96)]:
+        rs = RS(8, 0x187, 112, 11, nroots, pad)
+
+        messages = np.array([[randrange(256) for j in range(255 - nroots - pad)] for i in range(20)], dtype=np.uint8)
+        messages[0] = 0
+
+        parity = rs.encode_batch(messages)
+
+        for i in range(20):
+            assert parity[i].tolist() == rs.encode(messages[i].tolist())
+
+def test_rs_backends():
+    assert get_backend('python') is RS
+
+    with pytest.raises(ValueError):
+        get_backend('unknown')
+
+    if get_backend('auto') is not RS:
+        assert check_backend(get_backend('numpy'))
@@ -0,0 +1,107 @@
+#
+# test_scheduler.py
+# 
+# Copyright (C) 2023, Gabriel Mariano Marcelino - PU5GMA <gabriel.mm8@gmail.com>
+# 
+# This file is part of PyNGHam library.
+# 
+# PyNGHam library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# 
+# PyNGHam library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+# 
+# You should have received a copy of the GNU Lesser General Public License
+# along with PyNGHam library. If not, see <http://www.gnu.org/licenses/>.
+# 
+#
+
+
+
+import pyngham
+from random import randrange
+
+def test_scheduler_pack():
+    ext = pyngham.PyNGHamExtension()
+    pngh = pyngham.PyNGHam()
+    sch = pyngham.PyNGHamScheduler(pngh)
+
+    pkts = list()
+    for i in range(40):
+        pkt = ext.append_pkt(list(), 0, [randrange(256) for j in range(randrange(1, 60))])
+        pkts.append(pkt)
+        sch.add(pkt, randrange(10))
+
+    raw = bytes([randrange(256) for j in range(100)])
+    sch.add(raw, 0, raw=True)
+
+    pls = sch.schedule(now=100)
+
+    assert len(sch) == 0
+    assert sum([len(pl) for pl in pls]) == sum([len(pkt) for pkt in pkts]) + 100
+
+    # The extension packets can be decoded back from the frames
+    assert raw in pls
+
+    n = 0
+    for pl in pls:
+        assert len(pl) <= 220
+        if pl != raw:
+            n = n + ext.get_numpkts(list(pl))
+    assert n == len(pkts)
+
+    # Best-fit decreasing gets close to the minimum number of frames
+    assert len(pls) <= (sum([len(pkt) for pkt in pkts]) // 220) + 2 + 1
+
+def test_scheduler_deadlines():
+    ext = pyngham.PyNGHamExtension()
+    sch = pyngham.PyNGHamScheduler()
+
+    id_pkt = ext.append_id_pkt(list(), ext.encode_callsign("PU5GMA", 1), 1)
+    dest_pkt = ext.append_dest_pkt(list(), ext.encode_callsign("PU5GMB", 2))
+    big_pkt = ext.append_pkt(list(), 0, [randrange(256) for j in range(100)])
+
+    sch.add(id_pkt, 10)
+    sch.add(dest_pkt)
+    sch.add(big_pkt, 20)
+
+    assert sch.schedule(now=5) == []
+
+    # The ID packet is due and the DEST packet fills the same size class (28 bytes)
+    pls = sch.schedule(now=10)
+    assert pls == [bytes(id_pkt) + bytes(dest_pkt)]
+    assert len(sch) == 1
+
+    pkts = sch.encode(flush=True)
+    assert len(sch) == 0
+    assert len(pkts) == 1
+    assert pyngham.PyNGHam().decode(pkts[0])[0] == big_pkt
+
+def test_scheduler_invalid():
+    sch = pyngham.PyNGHamScheduler()
+
+    for pkt in [[], [0, 5, 1, 2], [0] * 221]:
+        try:
+            sch.add(pkt)
+            assert False
+        except ValueError:
+            pass
+
+    assert len(sch) == 0
+
+def test_scheduler_pending_raw():
+    sch = pyngham.PyNGHamScheduler()
+
+    sch.add([0, 3, 1, 2, 3], 0)
+    sch.add(b'RAWPAYLOAD', 100, raw=True)
+
+    # The raw payload is not used to fill the frame of the extension packet
+    assert sch.schedule(now=1) == [bytes([0, 3, 1, 2, 3])]
+    assert len(sch) == 1
+
+    assert sch.schedule(now=100) == [b'RAWPAYLOAD']
+    assert len(sch) == 0
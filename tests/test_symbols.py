@@ -0,0 +1,75 @@
+#
+# test_symbols.py
+# 
+# Copyright (C) 2023, Gabriel Mariano Marcelino - PU5GMA <gabriel.mm8@gmail.com>
+# 
+# This file is part of PyNGHam library.
+# 
+# PyNGHam library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# 
+# PyNGHam library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+# 
+# You should have received a copy of the GNU Lesser General Public License
+# along with PyNGHam library. If not, see <http://www.gnu.org/licenses/>.
+# 
+#
+
+
+import pytest
+
+from pyngham import PyNGHam
+from pyngham.symbols import bytes_to_symbols, symbols_to_bytes
+from random import randrange
+
+np = pytest.importorskip("numpy")
+
+def test_symbols_mapping():
+    data = bytes(range(256))
+
+    # Two level
+    sym = bytes_to_symbols(data, 0)
+
+    assert sym.dtype == np.int8
+    assert len(sym) == 8 * len(data)
+    assert set(sym.tolist()) == {-1, 1}
+    assert bytes(symbols_to_bytes(sym, 0)) == data
+
+    # Four level
+    sym = bytes_to_symbols(data, 1)
+
+    assert len(sym) == 4 * len(data)
+    assert set(sym.tolist()) == {-3, -1, 1, 3}
+    assert bytes(symbols_to_bytes(sym, 1)) == data
+
+    # Preambles
+    assert bytes_to_symbols([0xAA], 0).tolist() == [1, -1, 1, -1, 1, -1, 1, -1]
+    assert bytes_to_symbols([0xDD], 1).tolist() == [-3, 3, -3, 3]
+
+def test_symbols_batch():
+    data = np.array([[randrange(256) for j in range(47)] for i in range(10)], dtype=np.uint8)
+
+    for mod in [0, 1]:
+        sym = bytes_to_symbols(data, mod)
+
+        assert sym.shape[0] == 10
+
+        # Hard decision with noise smaller than half the distance between levels
+        noisy = sym + np.random.uniform(-0.9, 0.9, sym.shape)
+
+        assert (symbols_to_bytes(noisy, mod) == data).all()
+
+def test_symbols_pkt():
+    for mod in [0, 1]:
+        pngh = PyNGHam(mod)
+
+        pl = [randrange(256) for i in range(randrange(1, 220 + 1))]
+
+        sym = pngh.encode_symbols(pl)
+
+        assert pngh.decode_symbols(sym)[0] == pl
@@ -0,0 +1,129 @@
+#
+# test_sync.py
+# 
+# Copyright (C) 2023, Gabriel Mariano Marcelino - PU5GMA <gabriel.mm8@gmail.com>
+# 
+# This file is part of PyNGHam library.
+# 
+# PyNGHam library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# 
+# PyNGHam library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+# 
+# You should have received a copy of the GNU Lesser General Public License
+# along with PyNGHam library. If not, see <http://www.gnu.org/licenses/>.
+# 
+#
+
+
+
+import pytest
+
+import pyngham
+from random import randrange
+
+def test_sync_stream():
+    for mod in [0, 1]:
+        pngh = pyngham.PyNGHam(mod)
+        sync = pyngham.PyNGHamSync()
+
+        stream = bytearray()
+        pls = list()
+        for i in range(10):
+            # Noise between the packets
+            stream += bytes([randrange(256) for j in range(randrange(50))])
+
+            pl = [randrange(256) for j in range(randrange(1, 220 + 1))]
+            pkt = bytearray(pngh.encode_bytes(pl))
+
+            # Bit errors in the sync word (after the preamble)
+            sync_pos = 4 if mod == 0 else 8
+            for j in range(randrange(4)):
+                pkt[sync_pos + randrange(sync_pos)] ^= 1 << randrange(8)
+
+            stream += pkt
+            pls.append(pl)
+
+        # Stream received in chunks of random size
+        res = list()
+        pos = 0
+        while pos < len(stream):
+            n = randrange(1, 100)
+            res = res + sync.feed(stream[pos:pos + n])
+            pos = pos + n
+
+        assert [r[0] for r in res] == pls
+        assert [r[3] for r in res] == [mod] * len(pls)
+
+def test_sync_mod():
+    pkt = pyngham.PyNGHam(1).encode_bytes([1, 2, 3])
+
+    assert pyngham.PyNGHamSync(mod=0).feed(pkt) == []
+    assert pyngham.PyNGHamSync(mod=1).feed(pkt) == [([1, 2, 3], 0, [], 1)]
+
+    # Too many bit errors in the sync word
+    pkt = bytearray(pyngham.PyNGHam(0).encode_bytes([1, 2, 3]))
+    pkt[4] ^= 0x0F
+
+    assert pyngham.PyNGHamSync(max_errors=3).feed(pkt) == []
+    assert pyngham.PyNGHamSync(max_errors=4).feed(pkt) == [([1, 2, 3], 0, [], 0)]
+
+def test_sync_bits():
+    np = pytest.importorskip("numpy")
+
+    for mod in [0, 1]:
+        for packed in [False, True]:
+            pngh = pyngham.PyNGHam(mod)
+            sync = pyngham.PyNGHamBitSync()
+
+            bits = list()
+            pls = list()
+            for i in range(5):
+                # Noise between the packets (not aligned to bytes)
+                bits = bits + [randrange(2) for j in range(randrange(200))]
+
+                pl = [randrange(256) for j in range(randrange(1, 220 + 1))]
+                pkt_bits = list(np.unpackbits(np.frombuffer(pngh.encode_bytes(pl), dtype=np.uint8)))
+
+                # Bit errors in the sync word (after the preamble)
+                sync_pos = 32 if mod == 0 else 64
+                for j in range(randrange(4)):
+                    pkt_bits[sync_pos + randrange(sync_pos)] ^= 1
+
+                bits = bits + pkt_bits
+                pls.append(pl)
+
+            bits = bits + [0] * (-len(bits) % 8)
+
+            if packed:
+                stream = np.packbits(np.array(bits, dtype=np.uint8)).tobytes()
+            else:
+                stream = np.array(bits, dtype=np.uint8)
+
+            # Stream received in chunks of random size
+            res = list()
+            pos = 0
+            while pos < len(stream):
+                n = randrange(1, 1000)
+                res = res + sync.feed(stream[pos:pos + n], packed)
+                pos = pos + n
+
+            assert [r[0] for r in res] == pls
+            assert [r[3] for r in res] == [mod] * len(pls)
+
+def test_sync_bits_bytes():
+    np = pytest.importorskip("numpy")
+
+    pngh = pyngham.PyNGHam()
+    pl = [randrange(256) for j in range(randrange(1, 220 + 1))]
+
+    # Unpacked bits (one per byte) given as bytes, bytearray or memoryview
+    bits = bytes(np.unpackbits(np.frombuffer(pngh.encode_bytes(pl), dtype=np.uint8)))
+
+    for data in [bits, bytearray(bits), memoryview(bits)]:
+        assert pyngham.PyNGHamBitSync().feed(data) == [(pl, 0, [], 0)]
@@ -0,0 +1,122 @@
+#
+# test_txqueue.py
+# 
+# Copyright (C) 2023, Gabriel Mariano Marcelino - PU5GMA <gabriel.mm8@gmail.com>
+# 
+# This file is part of PyNGHam library.
+# 
+# PyNGHam library is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+# 
+# PyNGHam library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+# 
+# You should have received a copy of the GNU Lesser General Public License
+# along with PyNGHam library. If not, see <http://www.gnu.org/licenses/>.
+# 
+#
+
+
+
+import asyncio
+import pyngham
+from random import randrange
+
+def test_txqueue_priority():
+    async def run():
+        pngh = pyngham.PyNGHam()
+        q = pyngham.PyNGHamTXQueue(pngh)
+
+        data = [[randrange(256) for j in range(randrange(1, 220 + 1))] for i in range(3)]
+        cmd = [randrange(256) for j in range(10)]
+
+        for pl in data:
+            await q.put(pl, pyngham.TXPriority.LOW)
+        await q.put(cmd, pyngham.TXPriority.HIGH, 1)
+
+        assert q.qsize() == 4
+
+        assert await q.get() == pngh.encode_bytes(cmd, 1)
+        for pl in data:
+            assert await q.get() == pngh.encode_bytes(pl)
+
+        await q.put(cmd, spp=True)
+        assert list(await q.get()) == pyngham.PyNGHamSPP().encode_tx_pkt(0, cmd)
+
+        q.close()
+
+    asyncio.run(run())
+
+def test_txqueue_backpressure():
+    async def run():
+        pngh = pyngham.PyNGHam()
+        q = pyngham.PyNGHamTXQueue(pngh, maxsize=2)
+
+        pls = [[randrange(256) for j in range(50)] for i in range(5)]
+
+        async def produce():
+            for pl in pls:
+                await q.put(pl)
+
+        producer = asyncio.create_task(produce())
+
+        await asyncio.sleep(0.01)
+
+        assert q.full()
+        assert not producer.done()
+
+        for pl in pls:
+            assert await q.get() == pngh.encode_bytes(pl)
+
+        await producer
+
+        assert q.qsize() == 0
+
+        q.close()
+
+    asyncio.run(run())
+
+def test_txqueue_encode_order():
+    class PyNGHamLog(pyngham.PyNGHam):
+        def __init__(self):
+            super().__init__()
+            self.log = list()
+
+        def encode_bytes(self, pl, flags=0):
+            self.log.append(bytes(pl))
+            return super().encode_bytes(pl, flags)
+
+    async def run():
+        pngh = PyNGHamLog()
+        q = pyngham.PyNGHamTXQueue(pngh)
+
+        data = [bytes([i]) * 200 for i in range(3)]
+        cmd = bytes([randrange(256) for j in range(10)])
+
+        for pl in data:
+            await q.put(pl, pyngham.TXPriority.LOW)
+        await q.put(cmd, pyngham.TXPriority.HIGH)
+
+        for i in range(4):
+            await q.get()
+
+        # The high priority frame is encoded right after the frame being encoded
+        assert pngh.log == [data[0], cmd, data[1], data[2]]
+
+        # Invalid payloads
+        for pl in [[], bytes(221)]:
+            try:
+                await q.put(pl)
+                assert False
+            except ValueError:
+                pass
+
+        assert q.qsize() == 0
+
+        q.close()
+
+    asyncio.run(run())